@@ -8,6 +8,7 @@ from web3.exceptions import BadFunctionCallOutput, ContractLogicError
 
 from adapters.chain.artifacts import load_abi_from_out, load_abi_json
 from .base import DexAdapter
+from adapters.chain.multicall import Call3, aggregate3
 from adapters.chain.utils import get_sqrt_ratio_at_tick, get_amounts_for_liquidity
 
 
@@ -142,9 +143,40 @@ class AerodromeAdapter(DexAdapter):
         )] 
     
     def quote_amm(self, router_addr: str, factory_addr: str, token_in: str, token_out: str, amount_in_raw: int):
+        """
+        Quote volatile + stable routes in one Multicall3 round trip and keep the best.
+        Falls back to one getAmountsOut per route if Multicall3 is unavailable.
+        """
         r = self.aerodrome_router_amm(router_addr)
+        candidates = (False, True)
         best = None
-        for stable in (False, True):
+        try:
+            calls = [
+                Call3(
+                    target=r.address,
+                    call_data=r.encode_abi(
+                        "getAmountsOut",
+                        args=[int(amount_in_raw), self.build_amm_routes(token_in, token_out, stable, factory_addr)],
+                    ),
+                )
+                for stable in candidates
+            ]
+            for stable, (ok, data) in zip(candidates, aggregate3(self.w3, calls)):
+                if not ok:
+                    continue
+                try:
+                    (amounts,) = self.w3.codec.decode(["uint256[]"], data)
+                    out_raw = int(amounts[-1])
+                except Exception:
+                    continue
+                if out_raw > 0 and (not best or out_raw > best["out_raw"]):
+                    best = {"out_raw": out_raw, "stable": stable}
+            if best:
+                return best
+        except Exception:
+            best = None
+
+        for stable in candidates:
             routes = self.build_amm_routes(token_in, token_out, stable, factory_addr)
             try:
                 amounts = r.functions.getAmountsOut(int(amount_in_raw), routes).call()
@@ -1,12 +1,25 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 LIBS_ABI_DIR = Path("libs/abi")
 
 
+@lru_cache(maxsize=128)
+def _read_json(path: str) -> Any:
+    """
+    Parses an ABI/artifact file once per process.
+
+    Adapters are rebuilt on every request and each one loads its ABIs, so without
+    this every construction re-reads and re-parses the same JSON from disk.
+    The returned object is shared: callers must treat it as read-only.
+    """
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
 def load_abi_json(*parts: str) -> list:
     """
     Loads an ABI JSON list from libs/abi/... path.
@@ -16,7 +29,7 @@ def load_abi_json(*parts: str) -> list:
     p = LIBS_ABI_DIR.joinpath(*parts)
     if not p.exists():
         raise FileNotFoundError(f"ABI file not found: {p}")
-    data = json.loads(p.read_text(encoding="utf-8"))
+    data = _read_json(str(p))
     if not isinstance(data, list):
         raise ValueError(f"Expected ABI JSON list in {p}, got {type(data).__name__}")
     return data
@@ -32,7 +45,7 @@ def load_artifact(*parts: str) -> dict[str, Any]:
     p = LIBS_ABI_DIR.joinpath(*parts)
     if not p.exists():
         raise FileNotFoundError(f"Artifact file not found: {p}")
-    data = json.loads(p.read_text(encoding="utf-8"))
+    data = _read_json(str(p))
     if not isinstance(data, dict):
         raise ValueError(f"Expected artifact JSON object in {p}, got {type(data).__name__}")
     return data
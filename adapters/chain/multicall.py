@@ -0,0 +1,68 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Sequence, Tuple, Union
+
+from hexbytes import HexBytes
+from web3 import Web3
+
+# Multicall3 is deployed at the same address on Base, Ethereum, BSC, Arbitrum, Optimism, Polygon...
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+ABI_MULTICALL3_MIN = [
+    {
+        "name": "aggregate3",
+        "inputs": [
+            {
+                "name": "calls",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+            }
+        ],
+        "outputs": [
+            {
+                "name": "returnData",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+]
+
+
+@lru_cache(maxsize=64)
+def _multicall_contract(w3: Web3, address: str):
+    return w3.eth.contract(address=Web3.to_checksum_address(address), abi=ABI_MULTICALL3_MIN)
+
+
+@dataclass
+class Call3:
+    target: str
+    call_data: Union[str, bytes]
+    allow_failure: bool = True
+
+
+def aggregate3(w3: Web3, calls: Sequence[Call3], address: str = MULTICALL3_ADDRESS) -> List[Tuple[bool, bytes]]:
+    """
+    Run many eth_calls in a single round trip through Multicall3.aggregate3.
+
+    Returns one (success, returndata) pair per call, in order. Calls flagged with
+    allow_failure=True report success=False instead of reverting the whole batch.
+    """
+    if not calls:
+        return []
+
+    mc = _multicall_contract(w3, address)
+    res = mc.functions.aggregate3([
+        (Web3.to_checksum_address(c.target), bool(c.allow_failure), HexBytes(c.call_data))
+        for c in calls
+    ]).call()
+    return [(bool(ok), bytes(data)) for ok, data in res]
@@ -1,6 +1,8 @@
 from typing import Any, Dict, Optional
 from pydantic import BaseModel, Field
 
+from core.domain.enums.tx_enums import GasStrategy
+
 
 class HarvestJobPancakeRequest(BaseModel):
     """
@@ -19,7 +21,7 @@ class HarvestJobPancakeRequest(BaseModel):
     reward_amount_out_min: int = Field(0, ge=0, description="Min amount out for reward swap (raw).")
     reward_sqrt_price_limit_x96: int = Field(0, ge=0, description="0 = use config default.")
 
-    gas_strategy: str = Field(default="buffered", description="default|buffered|aggressive")
+    gas_strategy: GasStrategy = Field(default=GasStrategy.BUFFERED, description="default|buffered|aggressive")
     meta: Optional[Dict[str, Any]] = None
 
 
@@ -37,5 +39,5 @@ class CompoundJobPancakeRequest(BaseModel):
     compound0_min: int = Field(0, ge=0, description="Token0 min (raw).")
     compound1_min: int = Field(0, ge=0, description="Token1 min (raw).")
 
-    gas_strategy: str = Field(default="buffered", description="default|buffered|aggressive")
+    gas_strategy: GasStrategy = Field(default=GasStrategy.BUFFERED, description="default|buffered|aggressive")
     meta: Optional[Dict[str, Any]] = None
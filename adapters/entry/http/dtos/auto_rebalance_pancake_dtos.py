@@ -1,6 +1,8 @@
 from typing import Any, Dict, Optional
 from pydantic import BaseModel, Field
 
+from core.domain.enums.tx_enums import GasStrategy
+
 
 class AutoRebalancePancakeRequest(BaseModel):
     """
@@ -38,5 +40,5 @@ class AutoRebalancePancakeRequest(BaseModel):
     
     sqrt_price_limit_x96: int = Field(0, ge=0, description="Optional sqrtPriceLimitX96 (uint160). Usually 0")
 
-    gas_strategy: str = Field(default="buffered", description="default|buffered|aggressive")
+    gas_strategy: GasStrategy = Field(default=GasStrategy.BUFFERED, description="default|buffered|aggressive")
     meta: Optional[Dict[str, Any]] = None
@@ -23,6 +23,24 @@ class TxBudgetBlock(BaseModel):
     budget_exceeded: Optional[bool] = None
 
 
+# receipt fields echoed by default; logs/logsBloom (the bulk of a receipt) only on request
+_SLIM_RECEIPT_KEYS = (
+    "transactionHash",
+    "blockHash",
+    "blockNumber",
+    "status",
+    "gasUsed",
+    "effectiveGasPrice",
+    "contractAddress",
+)
+
+
+def _slim_receipt(receipt: Any) -> Any:
+    if not isinstance(receipt, dict):
+        return receipt
+    return {k: receipt[k] for k in _SLIM_RECEIPT_KEYS if k in receipt}
+
+
 class TxRunResponse(BaseModel):
     tx_hash: str
     broadcasted: bool
@@ -47,6 +65,7 @@ class TxRunResponse(BaseModel):
         vault_address: Optional[str] = None,
         alias: Optional[str] = None,
         mongo_id: Optional[str] = None,
+        include_receipt: bool = False,
     ) -> "TxRunResponse":
         if isinstance(tx_any, dict):
             tx = tx_any
@@ -76,7 +95,7 @@ class TxRunResponse(BaseModel):
         return cls(
             tx_hash=str(tx.get("tx_hash") or ""),
             broadcasted=bool(tx.get("broadcasted", True)),
-            receipt=(tx.get("receipt") if isinstance(tx.get("receipt"), dict) else tx.get("receipt")),
+            receipt=(tx.get("receipt") if include_receipt else _slim_receipt(tx.get("receipt"))),
             status=(tx.get("status") if isinstance(tx.get("status"), int) else None),
             gas=(TxGasBlock.model_validate(tx.get("gas") or {}) if isinstance(tx.get("gas"), dict) else None),
             budget=(TxBudgetBlock.model_validate(tx.get("budget") or {}) if isinstance(tx.get("budget"), dict) else None),
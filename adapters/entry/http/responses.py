@@ -0,0 +1,21 @@
+# adapters/entry/http/responses.py
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered by pydantic-core's Rust encoder instead of stdlib json.
+
+    Same compact UTF-8 output as JSONResponse. Unlike orjson it keeps ints wider than
+    64 bits exact (sqrtPriceX96, liquidity, raw uint256 amounts). NaN/Infinity are
+    emitted as null instead of failing the response.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content, inf_nan_mode="null")
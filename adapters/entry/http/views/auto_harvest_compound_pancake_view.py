@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from adapters.entry.http.dtos.auto_harvest_compound_pancake_dtos import (
     HarvestJobPancakeRequest,
@@ -23,6 +23,7 @@ def get_use_case() -> AutoHarvestCompoundPancakeUseCase:
 async def harvest_job(
     alias: str,
     body: HarvestJobPancakeRequest,
+    include_receipt: bool = Query(False, description="Return the full tx receipt (logs included)."),
     use_case: AutoHarvestCompoundPancakeUseCase = Depends(get_use_case),
 ):
     try:
@@ -42,6 +43,7 @@ async def harvest_job(
             vault_address=out.get("vault_address"),
             alias=out.get("alias"),
             mongo_id=None,
+            include_receipt=include_receipt,
         )
 
     except ValueError as exc:
@@ -77,6 +79,7 @@ async def harvest_job(
 async def compound_job(
     alias: str,
     body: CompoundJobPancakeRequest,
+    include_receipt: bool = Query(False, description="Return the full tx receipt (logs included)."),
     use_case: AutoHarvestCompoundPancakeUseCase = Depends(get_use_case),
 ):
     try:
@@ -94,6 +97,7 @@ async def compound_job(
             vault_address=out.get("vault_address"),
             alias=out.get("alias"),
             mongo_id=None,
+            include_receipt=include_receipt,
         )
 
     except ValueError as exc:
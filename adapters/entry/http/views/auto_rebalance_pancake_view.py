@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.concurrency import run_in_threadpool
 
 from adapters.entry.http.dtos.auto_rebalance_pancake_dtos import AutoRebalancePancakeRequest
@@ -21,6 +21,7 @@ def get_use_case() -> AutoRebalancePancakeUseCase:
 async def auto_rebalance_pancake(
     alias: str,
     body: AutoRebalancePancakeRequest,
+    include_receipt: bool = Query(False, description="Return the full tx receipt (logs included)."),
     use_case: AutoRebalancePancakeUseCase = Depends(get_use_case),
 ):
     try:
@@ -45,6 +46,7 @@ async def auto_rebalance_pancake(
             vault_address=out.get("vault_address"),
             alias=out.get("alias"),
             mongo_id=None,
+            include_receipt=include_receipt,
         )
 
     except ValueError as exc:
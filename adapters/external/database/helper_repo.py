@@ -1,5 +1,12 @@
 from typing import Any
 
+# MongoDB suporta apenas int64
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+# Tipos que o BSON aceita como estão: checados primeiro (caso mais comum em payloads de tx)
+_PASSTHROUGH_TYPES = frozenset({str, float, bool, type(None)})
+
 
 def sanitize_for_mongo(value: Any) -> Any:
     """
@@ -8,13 +15,11 @@ def sanitize_for_mongo(value: Any) -> Any:
     - ints maiores que 8 bytes viram string
     - dicts e listas são tratados recursivamente
     """
-    from math import inf
+    if type(value) in _PASSTHROUGH_TYPES:
+        return value
 
     if isinstance(value, int):
-        # MongoDB suporta apenas int64
-        min_int64 = -(2**63)
-        max_int64 = 2**63 - 1
-        if min_int64 <= value <= max_int64:
+        if _INT64_MIN <= value <= _INT64_MAX:
             return value
         # Se ultrapassar o limite, salva como string
         return str(value)
@@ -28,5 +33,5 @@ def sanitize_for_mongo(value: Any) -> Any:
     if isinstance(value, tuple):
         return tuple(sanitize_for_mongo(v) for v in value)
 
-    # Outros tipos (str, float, None, bool, etc.) passam direto
+    # Outros tipos passam direto
     return value
@@ -6,6 +6,7 @@ from typing import Optional
 
 from pymongo import MongoClient
 from pymongo.database import Database
+from pymongo.write_concern import WriteConcern
 
 from config import get_settings
 
@@ -21,6 +22,9 @@ def get_mongo_client() -> MongoClient:
 
     - MONGO_URI: Full MongoDB connection string
       (for example: "mongodb://localhost:27017" or an Atlas connection string)
+    - MONGO_MAX_POOL_SIZE: Max connections in the pool (per process)
+    - MONGO_COMPRESSORS: Wire compressors, e.g. "zstd,snappy,zlib"
+    - MONGO_ZLIB_COMPRESSION_LEVEL: zlib level (-1..9) used when zlib is negotiated
 
     The client is created lazily and cached at module level so that subsequent
     calls reuse the same underlying connection pool.
@@ -34,7 +38,12 @@ def get_mongo_client() -> MongoClient:
                 "MONGO_URI is not configured. Please set it in your settings "
                 "so the vault subsystem can connect to MongoDB."
             )
-        _client = MongoClient(uri)
+        _client = MongoClient(
+            uri,
+            maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+            compressors=settings.MONGO_COMPRESSORS or None,
+            zlibCompressionLevel=settings.MONGO_ZLIB_COMPRESSION_LEVEL,
+        )
     return _client
 
 
@@ -60,3 +69,14 @@ def get_mongo_db() -> Database:
             )
         _db = get_mongo_client()[db_name]
     return _db
+
+
+def get_mongo_db_for_migration() -> Database:
+    """
+    Return the default Database with unacknowledged writes (w=0), for bulk one-off
+    migrations of data that can be re-migrated (e.g. historical events).
+
+    Shares the singleton client and its pool; writes are fire-and-forget, so
+    server-side errors (duplicates, validation) are not reported back.
+    """
+    return get_mongo_db().with_options(write_concern=WriteConcern(w=0))
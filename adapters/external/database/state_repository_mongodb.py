@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 from adapters.external.database.vault_events_repository_mongodb import VaultEventsRepository
@@ -12,20 +13,28 @@ from core.domain.repositories.vault_state_repository_interface import VaultState
 from core.services.normalize import _norm_lower
 
 
-_state_repo: VaultStateRepositoryInterface = VaultStateRepository()
-_events_repo: VaultEventsRepositoryInterface = VaultEventsRepository()
+# Built on first use: the repositories connect and ensure indexes in __init__,
+# which should not run as a side effect of importing this module.
+@lru_cache(maxsize=1)
+def _state_repo() -> VaultStateRepositoryInterface:
+    return VaultStateRepository()
+
+
+@lru_cache(maxsize=1)
+def _events_repo() -> VaultEventsRepositoryInterface:
+    return VaultEventsRepository()
 
 
 def load_state(dex: str, alias: str) -> Dict[str, Any]:
-    return _state_repo.get_state(_norm_lower(dex), _norm_lower(alias))
+    return _state_repo().get_state(_norm_lower(dex), _norm_lower(alias))
 
 
 def save_state(dex: str, alias: str, data: Dict[str, Any]) -> None:
-    _state_repo.upsert_state(_norm_lower(dex), _norm_lower(alias), data)
+    _state_repo().upsert_state(_norm_lower(dex), _norm_lower(alias), data)
 
 
 def update_state(dex: str, alias: str, updates: Dict[str, Any]) -> None:
-    _state_repo.patch_state(_norm_lower(dex), _norm_lower(alias), updates)
+    _state_repo().patch_state(_norm_lower(dex), _norm_lower(alias), updates)
 
 
 def ensure_state_initialized(
@@ -110,7 +119,7 @@ def append_history(dex: str, alias: str, key: str, entry: Dict[str, Any]) -> Non
         "rewards_collect_history": "rewards_collect",
     }
     kind = mapping.get(key, key)
-    _events_repo.append_event(_norm_lower(dex), _norm_lower(alias), _norm_lower(kind), entry)
+    _events_repo().append_event(_norm_lower(dex), _norm_lower(alias), _norm_lower(kind), entry)
 
 
 def add_collected_fees_snapshot(
@@ -136,7 +145,7 @@ def add_collected_fees_snapshot(
 
     save_state(dex_n, alias_n, st)
 
-    _events_repo.append_event(
+    _events_repo().append_event(
         dex_n,
         alias_n,
         "fees_collect",
@@ -168,7 +177,7 @@ def add_rewards_usdc_snapshot(
 
     save_state(dex_n, alias_n, st)
 
-    _events_repo.append_event(
+    _events_repo().append_event(
         dex_n,
         alias_n,
         "rewards_collect",
@@ -167,8 +167,7 @@ class VaultRegistryRepositoryMongoDB(VaultRegistryRepositoryInterface):
             set_doc["config"] = cfg
 
         # touch timestamps (ms/iso) consistently with entity base
-        now_ms = VaultRegistryEntity.now_ms()
-        now_iso = VaultRegistryEntity.now_iso()
+        now_ms, now_iso = VaultRegistryEntity.now_stamp()
         set_doc["updated_at"] = now_ms
         set_doc["updated_at_iso"] = now_iso
 
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import time
-from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 from pymongo.collection import Collection
@@ -25,6 +23,14 @@ class VaultEventsRepository(VaultEventsRepositoryInterface):
 
     COLLECTION_NAME = "vault_events"
 
+    # (keys, create_index options); main.py derives its index marker from these
+    INDEXES = (
+        (
+            [("dex", 1), ("alias", 1), ("kind", 1), ("ts", -1)],
+            {"name": "ix_vault_events_dex_alias_kind_ts_desc"},
+        ),
+    )
+
     def __init__(self, db: Optional[Database] = None) -> None:
         self._db: Database = db if db is not None else get_mongo_db()
         self._collection: Collection = self._db[self.COLLECTION_NAME]
@@ -35,14 +41,13 @@ class VaultEventsRepository(VaultEventsRepositoryInterface):
         return self._collection
 
     def ensure_indexes(self) -> None:
-        self._collection.create_index(
-            [("dex", 1), ("alias", 1), ("kind", 1), ("ts", -1)],
-            name="ix_vault_events_dex_alias_kind_ts_desc",
-        )
+        for keys, options in self.INDEXES:
+            self._collection.create_index(keys, **options)
 
     def append_event(self, dex: str, alias: str, kind: str, payload: Dict[str, Any]) -> None:
-        now_s = int(time.time())
-        now_iso = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        # one clock read for ts/ts_iso/created_at/updated_at
+        now_ms, now_iso = VaultEvent.now_stamp()
+        now_s = now_ms // 1000
 
         event = VaultEvent(
             dex=_norm_lower(dex),
@@ -53,8 +58,8 @@ class VaultEventsRepository(VaultEventsRepositoryInterface):
             payload=payload or {},
         )
 
-        event.created_at = event.now_ms()
-        event.created_at_iso = event.now_iso()
+        event.created_at = now_ms
+        event.created_at_iso = now_iso
         event.updated_at = event.created_at
         event.updated_at_iso = event.created_at_iso
 
@@ -23,6 +23,11 @@ class VaultStateRepository(VaultStateRepositoryInterface):
 
     COLLECTION_NAME = "vault_state"
 
+    # (keys, create_index options); main.py derives its index marker from these
+    INDEXES = (
+        ([("dex", 1), ("alias", 1)], {"unique": True, "name": "ux_vault_state_dex_alias"}),
+    )
+
     def __init__(self, db: Optional[Database] = None) -> None:
         self._db: Database = db if db is not None else get_mongo_db()
         self._collection: Collection = self._db[self.COLLECTION_NAME]
@@ -33,11 +38,8 @@ class VaultStateRepository(VaultStateRepositoryInterface):
         return self._collection
 
     def ensure_indexes(self) -> None:
-        self._collection.create_index(
-            [("dex", 1), ("alias", 1)],
-            unique=True,
-            name="ux_vault_state_dex_alias",
-        )
+        for keys, options in self.INDEXES:
+            self._collection.create_index(keys, **options)
 
     def _get_state_doc(self, dex: str, alias: str) -> Optional[VaultStateDocument]:
         dex_n = _norm_lower(dex)
@@ -60,8 +62,7 @@ class VaultStateRepository(VaultStateRepositoryInterface):
             entity.alias = alias_n
             entity.state = state
 
-            now_ms = entity.now_ms()
-            now_iso = entity.now_iso()
+            now_ms, now_iso = entity.now_stamp()
 
             if entity.created_at is None:
                 entity.created_at = now_ms
@@ -79,8 +80,7 @@ class VaultStateRepository(VaultStateRepositoryInterface):
 
         entity = VaultStateDocument(dex=dex_n, alias=alias_n, state=state)
 
-        now_ms = entity.now_ms()
-        now_iso = entity.now_iso()
+        now_ms, now_iso = entity.now_stamp()
         entity.created_at = now_ms
         entity.created_at_iso = now_iso
         entity.updated_at = now_ms
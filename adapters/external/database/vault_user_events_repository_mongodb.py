@@ -56,11 +56,12 @@ class VaultUserEventsRepositoryMongoDB:
         doc = sanitize_for_mongo(entity.to_mongo())
         doc = self._normalize_doc(doc)
 
-        # ensure event timestamps exist
+        # ensure event timestamps exist (same instant touch_for_insert just stamped)
+        now_ms, now_iso = int(entity.updated_at), str(entity.updated_at_iso)
         if doc.get("ts_ms") is None:
-            doc["ts_ms"] = int(entity.now_ms())
+            doc["ts_ms"] = now_ms
         if doc.get("ts_iso") is None:
-            doc["ts_iso"] = str(entity.now_iso())
+            doc["ts_iso"] = now_iso
 
         q = {
             "chain": doc.get("chain"),
@@ -77,7 +78,7 @@ class VaultUserEventsRepositoryMongoDB:
         
         saved = self._col.find_one_and_update(
             q,
-            {"$setOnInsert": insert_doc, "$set": {"updated_at": entity.now_ms(), "updated_at_iso": entity.now_iso()}},
+            {"$setOnInsert": insert_doc, "$set": {"updated_at": now_ms, "updated_at_iso": now_iso}},
             upsert=True,
             return_document=ReturnDocument.AFTER,
         )
@@ -3,7 +3,7 @@ from dotenv import load_dotenv
 from dataclasses import dataclass, field
 from pydantic import Field
 from functools import lru_cache
-from typing import List
+from typing import FrozenSet, List
 
 load_dotenv()
 
@@ -18,7 +18,7 @@ def _parse_csv(value: str, *, lower: bool = False) -> List[str]:
     return items
 
 
-@dataclass
+@dataclass(frozen=True)
 class Settings:
     # MongoDB
     MONGO_URI: str
@@ -46,6 +46,22 @@ class Settings:
     LOG_LEVEL: str = Field(default="INFO")
 
     STABLE_TOKEN_ADDRESSES: List[str] = field(default_factory=list)
+    # lowercased STABLE_TOKEN_ADDRESSES for O(1) membership checks (built once in get_settings)
+    STABLE_TOKEN_SET: FrozenSet[str] = frozenset()
+
+    # max eth_calls per JSON-RPC batch (providers cap batch size)
+    RPC_BATCH_SIZE: int = 100
+
+    # MongoClient pool size and wire compression (comma-separated, in preference order;
+    # zstd/snappy need the optional zstandard/python-snappy packages, zlib is built in)
+    MONGO_MAX_POOL_SIZE: int = 64
+    MONGO_COMPRESSORS: str = "zlib"
+    # zlib level (-1..9) when zlib is negotiated; 1 keeps per-query CPU low on the API
+    MONGO_ZLIB_COMPRESSION_LEVEL: int = 1
+
+    # reuse a process-local nonce instead of asking the node on every send.
+    # Only safe when this process is the single sender for PRIVATE_KEY.
+    TX_LOCAL_NONCE_CACHE: bool = False
 
 
 @lru_cache()
@@ -63,10 +79,16 @@ def get_settings() -> Settings:
         PRIVATE_KEY=os.getenv("PRIVATE_KEY", ""),
         RPC_URL_DEFAULT=os.getenv("RPC_URL_DEFAULT", ""),  # keep as-is, but name suggests you may rename later
         STABLE_TOKEN_ADDRESSES=stable_list,
+        STABLE_TOKEN_SET=frozenset(x.strip().lower() for x in stable_list if x.strip()),
+        RPC_BATCH_SIZE=int(os.getenv("RPC_BATCH_SIZE", "100")),
 
         # Mongo
         MONGO_URI=os.getenv("MONGO_URI", "mongodb://mongo-lp:27017/lp_vaults"),
         MONGO_DB=os.getenv("MONGO_DB", "lp_vaults"),
+        MONGO_MAX_POOL_SIZE=int(os.getenv("MONGO_MAX_POOL_SIZE", "64")),
+        MONGO_COMPRESSORS=os.getenv("MONGO_COMPRESSORS", "zlib"),
+        MONGO_ZLIB_COMPRESSION_LEVEL=int(os.getenv("MONGO_ZLIB_COMPRESSION_LEVEL", "1")),
+        TX_LOCAL_NONCE_CACHE=os.getenv("TX_LOCAL_NONCE_CACHE", "false").strip().lower() in ("1", "true", "yes"),
 
         # Contracts
         STRATEGY_REGISTRY_ADDRESS=os.getenv("STRATEGY_REGISTRY_ADDRESS", ""),
@@ -55,6 +55,14 @@ class MongoEntity(BaseModel):
         """
         return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
+    @staticmethod
+    def now_stamp() -> tuple[int, str]:
+        """
+        Return (now_ms, now_iso) from a single clock read, so both fields agree.
+        """
+        dt = datetime.now(timezone.utc)
+        return int(dt.timestamp() * 1000), dt.isoformat().replace("+00:00", "Z")
+
     @classmethod
     def from_mongo(cls: Type[E], doc: Optional[dict[str, Any]]) -> Optional[E]:
         """
@@ -109,8 +117,7 @@ class MongoEntity(BaseModel):
         return data
 
     def touch_for_insert(self: E) -> E:
-        now_ms = self.now_ms()
-        now_iso = self.now_iso()
+        now_ms, now_iso = self.now_stamp()
 
         if self.created_at is None:
             self.created_at = now_ms
@@ -123,8 +130,7 @@ class MongoEntity(BaseModel):
 
 
     def touch_for_update(self: E) -> E:
-        now_ms = self.now_ms()
-        now_iso = self.now_iso()
+        now_ms, now_iso = self.now_stamp()
 
         self.updated_at = now_ms
         self.updated_at_iso = now_iso
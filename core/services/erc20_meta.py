@@ -0,0 +1,67 @@
+# core/services/erc20_meta.py
+
+from __future__ import annotations
+
+from time import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from web3 import Web3
+
+from core.services.rpc_batch import CallSpec
+
+# ERC20 views (decimals 0x313ce567, symbol 0x95d89b41).
+SEL_ERC20_DECIMALS = "0x" + Web3.keccak(text="decimals()")[:4].hex()
+SEL_ERC20_SYMBOL = "0x" + Web3.keccak(text="symbol()")[:4].hex()
+
+# decimals/symbol never change for a deployed token: one read per (chain, token) per process.
+_ERC20_META_CACHE: Dict[str, Tuple[float, Tuple[int, Optional[str]]]] = {}
+_ERC20_META_TTL_SEC = 24 * 60 * 60
+
+
+def _key(chain: str, token_addr: str) -> str:
+    return f"{(chain or '').strip().lower()}:{token_addr.lower()}"
+
+
+def erc20_meta_calls(token_addr: str) -> List[CallSpec]:
+    """decimals() + symbol() calls for one token, to be sent through batch_eth_call."""
+    return [
+        CallSpec(to=token_addr, data=SEL_ERC20_DECIMALS, out_types=["uint8"]),
+        CallSpec(to=token_addr, data=SEL_ERC20_SYMBOL, out_types=["string"]),
+    ]
+
+
+def read_erc20_decimals(w3: Web3, token_addr: str) -> int:
+    """
+    Plain eth_call of decimals(): the uint8 comes back as one 32-byte word, decoded
+    with int.from_bytes instead of going through a Contract/ABI lookup. RPC errors propagate.
+    """
+    raw = bytes(w3.eth.call({"to": Web3.to_checksum_address(token_addr), "data": SEL_ERC20_DECIMALS}))
+    if len(raw) < 32:
+        raise ValueError(f"decimals() returned no data for token {token_addr}")
+    return int.from_bytes(raw[:32], "big")
+
+
+def get_erc20_meta(chain: str, token_addr: str) -> Optional[Tuple[int, Optional[str]]]:
+    """Cached (decimals, symbol|None) or None on miss."""
+    hit = _ERC20_META_CACHE.get(_key(chain, token_addr))
+    if not hit:
+        return None
+    ts, meta = hit
+    if (time() - ts) > _ERC20_META_TTL_SEC:
+        return None
+    return meta
+
+
+def set_erc20_meta(chain: str, token_addr: str, res: List[Optional[Any]]) -> Optional[Tuple[int, Optional[str]]]:
+    """
+    Stores results decoded from erc20_meta_calls(). Returns (decimals, symbol|None).
+
+    Nothing is cached when decimals() failed: a transient RPC error must not pin a
+    default decimals value that later feeds raw-amount math for a transaction.
+    A failing symbol() is cached as None (non-standard tokens, e.g. bytes32 symbols).
+    """
+    if not res or res[0] is None:
+        return None
+    meta = (int(res[0]), str(res[1]) if len(res) > 1 and res[1] is not None else None)
+    _ERC20_META_CACHE[_key(chain, token_addr)] = (time(), meta)
+    return meta
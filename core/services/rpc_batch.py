@@ -0,0 +1,134 @@
+# core/services/rpc_batch.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from time import time
+from typing import Any, Dict, List, Optional
+
+from hexbytes import HexBytes
+from web3 import Web3
+
+from adapters.chain.multicall import Call3, aggregate3
+from config import get_settings
+from core.services.web3_cache import get_http_session
+
+# endpoint -> when it last rejected a batch; skipped for the TTL, then probed again
+_BATCH_REJECTED_AT: Dict[str, float] = {}
+_BATCH_REJECT_TTL_SEC = 10 * 60  # 10 minutes
+
+
+@dataclass
+class CallSpec:
+    to: str
+    data: str
+    out_types: List[str]
+
+
+def _decode(w3: Web3, spec: CallSpec, raw_hex_or_bytes: Any) -> Optional[Any]:
+    try:
+        if raw_hex_or_bytes is None:
+            return None
+        decoded = w3.codec.decode(spec.out_types, HexBytes(raw_hex_or_bytes))  # type: ignore[attr-defined]
+        if len(spec.out_types) == 1:
+            return decoded[0]
+        return tuple(decoded)
+    except Exception:
+        return None
+
+
+def _post_batch(w3: Web3, endpoint: str, calls: List[CallSpec], timeout: float) -> Optional[List[Optional[Any]]]:
+    """
+    One JSON-RPC batch POST. Returns None if the provider rejects batches
+    (non-list reply, every item an error, HTTP/transport error) so the caller
+    can fall back.
+    """
+    payload = [
+        {
+            "jsonrpc": "2.0",
+            "id": i + 1,
+            "method": "eth_call",
+            "params": [{"to": Web3.to_checksum_address(c.to), "data": c.data}, "latest"],
+        }
+        for i, c in enumerate(calls)
+    ]
+    try:
+        r = get_http_session(endpoint).post(endpoint, json=payload, timeout=timeout)
+        data = r.json()
+    except Exception:
+        return None
+    if not isinstance(data, list):
+        return None
+    # per-item errors on every call (e.g. "batch size exceeded") are a rejection too
+    if all(not isinstance(it, dict) or "error" in it for it in data):
+        return None
+
+    by_id = {it.get("id"): it for it in data if isinstance(it, dict)}
+    out: List[Optional[Any]] = []
+    for i, spec in enumerate(calls):
+        it = by_id.get(i + 1) or {}
+        if "error" in it:
+            out.append(None)
+            continue
+        out.append(_decode(w3, spec, it.get("result")))
+    return out
+
+
+def _multicall_batch(w3: Web3, calls: List[CallSpec]) -> Optional[List[Optional[Any]]]:
+    """
+    Same calls through Multicall3.aggregate3 (one eth_call, allowFailure=True per call).
+    Returns None if Multicall3 is unavailable on the chain so the caller can fall back.
+    """
+    try:
+        res = aggregate3(w3, [Call3(target=c.to, call_data=c.data) for c in calls])
+    except Exception:
+        return None
+    return [_decode(w3, spec, data) if ok else None for spec, (ok, data) in zip(calls, res)]
+
+
+def batch_eth_call(
+    w3: Web3,
+    calls: List[CallSpec],
+    *,
+    batch_size: Optional[int] = None,
+    timeout: float = 12,
+) -> List[Optional[Any]]:
+    """
+    Batch JSON-RPC eth_call. If the provider rejects batches, the chunk goes through
+    Multicall3.aggregate3 (still one round trip), then sequential eth_call as last resort.
+    A rejecting endpoint is remembered for _BATCH_REJECT_TTL_SEC, so later chunks and
+    calls go straight to Multicall3 instead of paying the failed POST again.
+    Returns decoded values (single output => value, multi => tuple), None on error per-call.
+
+    Calls are split into chunks of `batch_size` (default: settings.RPC_BATCH_SIZE)
+    since many providers cap the number of requests per batch.
+    """
+    if not calls:
+        return []
+
+    size = int(batch_size or get_settings().RPC_BATCH_SIZE or len(calls))
+    endpoint = getattr(w3.provider, "endpoint_uri", None)
+    endpoint = str(endpoint) if endpoint else None
+
+    out: List[Optional[Any]] = []
+    for start in range(0, len(calls), size):
+        chunk = calls[start:start + size]
+
+        res = None
+        if endpoint and time() - _BATCH_REJECTED_AT.get(endpoint, 0.0) >= _BATCH_REJECT_TTL_SEC:
+            res = _post_batch(w3, endpoint, chunk, timeout)
+            if res is None:
+                _BATCH_REJECTED_AT[endpoint] = time()
+        if res is None:
+            res = _multicall_batch(w3, chunk)
+        if res is None:
+            # fallback sequential
+            res = []
+            for spec in chunk:
+                try:
+                    raw = w3.eth.call({"to": Web3.to_checksum_address(spec.to), "data": spec.data})
+                    res.append(_decode(w3, spec, raw))
+                except Exception:
+                    res.append(None)
+        out.extend(res)
+    return out
@@ -3,16 +3,59 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from decimal import Decimal
-from typing import Any, Literal, Optional, Sequence
+from functools import lru_cache
+from threading import Lock
+from time import time
+from typing import Any, Dict, Literal, Optional, Sequence, Tuple
 
 from eth_account import Account
+from hexbytes import HexBytes
 from web3 import Web3
 from web3.contract.contract import ContractFunction
 
 from config import get_settings
 from core.domain.enums.tx_enums import GasStrategy
-from core.services.utils import to_json_safe
+from core.services.utils import POW10, to_json_safe
 from core.services.exceptions import TransactionBudgetExceededError, TransactionRevertedError
+from core.services.web3_cache import get_web3
+
+# ---- local nonce tracking (opt-in: settings.TX_LOCAL_NONCE_CACHE) ----
+# Relies on a single sender per key: this process must be the only thing signing with
+# PRIVATE_KEY, otherwise another signer moves the real pending nonce and the cached one
+# goes stale ("nonce too low"). Nonces are reserved under the lock at broadcast time
+# (the cache holds the next free one), so concurrent sends never share a nonce.
+# Entries are short-lived and dropped on any send failure, falling back to the node's
+# "pending" count.
+_NONCE_CACHE: Dict[str, Tuple[float, int]] = {}
+_NONCE_TTL_SEC = 30
+_NONCE_LOCK = Lock()
+
+
+# placeholder limit for build_transaction; replaced before signing
+_PROVISIONAL_GAS = 1
+
+# gas padding per strategy as integer (num, den, extra): limit = est * num // den + extra
+# ("default" => no padding). Integer math keeps the limit exact for any estimate.
+_GAS_PADDING: Dict[str, Tuple[int, int, int]] = {
+    "buffered": (5, 4, 10_000),
+    "aggressive": (3, 2, 25_000),
+}
+
+_WEI_PER_ETH = Decimal(POW10[18])
+
+
+def _pad_gas(base_estimate: int, strategy: str) -> int:
+    pad = _GAS_PADDING.get(strategy)
+    if pad is None:
+        return base_estimate
+    num, den, extra = pad
+    return base_estimate * num // den + extra
+
+
+@lru_cache(maxsize=4)
+def _account_from_key(pk: str):
+    return Account.from_key(pk)
+
 
 @dataclass
 class _BudgetBlock:
@@ -28,7 +71,24 @@ class _BudgetBlock:
             "usd_estimated_upper_bound": self.usd_estimated_upper_bound,
             "budget_exceeded": self.budget_exceeded,
         }
-        
+
+
+@dataclass(frozen=True)
+class ReceiptPollCfg:
+    """
+    Receipt wait tuning for wait=True sends.
+
+    web3's default polls every 0.1s for up to 120s: chatty while pending and slow to
+    give up after a dropped/replaced tx. L2 blocks land every ~1-2s, so a 1s poll
+    returns right after inclusion and 60s bounds the wait.
+    """
+    poll_latency_s: float = 1.0
+    timeout_s: float = 60.0
+
+
+DEFAULT_RECEIPT_POLL = ReceiptPollCfg()
+
+
 class TxService:
     """
     High-level transaction sender for vault ops.
@@ -43,35 +103,76 @@ class TxService:
 
     def __init__(self, rpc_url: str | None = None):
         s = get_settings()
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url or s.RPC_URL_DEFAULT))
+        self.rpc_url = rpc_url or s.RPC_URL_DEFAULT
+        self.w3 = get_web3(self.rpc_url)
         self.pk = s.PRIVATE_KEY
-        self.account = Account.from_key(self.pk)
+        self.account = _account_from_key(self.pk)
+        self.local_nonce = bool(s.TX_LOCAL_NONCE_CACHE)
 
     def sender_address(self) -> str:
         return self.account.address
 
     # ---------- internal helpers ----------
 
+    def _nonce_key(self) -> str:
+        return f"{self.rpc_url.strip()}:{self.account.address.lower()}"
+
     def _next_nonce(self) -> int:
+        """
+        Nonce used to build the tx. Only a peek: with the local cache enabled the
+        final nonce is reserved in _broadcast, so a build that fails never burns one.
+        """
+        if self.local_nonce:
+            with _NONCE_LOCK:
+                hit = _NONCE_CACHE.get(self._nonce_key())
+                if hit and (time() - hit[0]) <= _NONCE_TTL_SEC:
+                    return hit[1]
         return self.w3.eth.get_transaction_count(self.account.address, "pending")
 
-    def _estimate_with_strategy(self, tx: dict, strategy: GasStrategy) -> int:
+    def _reserve_nonce(self) -> int:
         """
-        Calls estimateGas(tx) and applies a safety buffer depending on strategy.
-        Falls back to a static 300k if node estimation fails.
+        Hands out the next nonce and stores n+1 under the lock, so two concurrent
+        sends from this process can never get the same one.
+        """
+        key = self._nonce_key()
+        with _NONCE_LOCK:
+            hit = _NONCE_CACHE.get(key)
+            if hit and (time() - hit[0]) <= _NONCE_TTL_SEC:
+                n = hit[1]
+            else:
+                n = int(self.w3.eth.get_transaction_count(self.account.address, "pending"))
+            _NONCE_CACHE[key] = (time(), n + 1)
+        return n
+
+    def _forget_nonce(self) -> None:
+        with _NONCE_LOCK:
+            _NONCE_CACHE.pop(self._nonce_key(), None)
+
+    def _broadcast(self, tx: dict) -> str:
+        """
+        Signs + sends, keeping the local nonce cache in sync with the outcome.
         """
+        if not self.local_nonce:
+            signed = self.w3.eth.account.sign_transaction(tx, self.pk)
+            return self.w3.eth.send_raw_transaction(signed.raw_transaction).hex()
+
+        tx["nonce"] = self._reserve_nonce()
         try:
-            base_estimate = int(self.w3.eth.estimate_gas(tx))
+            signed = self.w3.eth.account.sign_transaction(tx, self.pk)
+            txh = self.w3.eth.send_raw_transaction(signed.raw_transaction)
         except Exception:
-            base_estimate = 300_000
+            self._forget_nonce()
+            raise
+        return txh.hex()
 
-        if strategy == "default":
-            return base_estimate
-        if strategy == "buffered":
-            return int(base_estimate * 1.25) + 10_000
-        if strategy == "aggressive":
-            return int(base_estimate * 1.5) + 25_000
-        return base_estimate  # fallback
+    def _estimate_with_strategy(self, tx: dict, strategy: GasStrategy) -> int:
+        """
+        Calls estimateGas(tx) and applies a safety buffer depending on strategy.
+        Estimation errors propagate: this is the only estimate before broadcast,
+        so it is what rejects reverting or unfunded txs.
+        """
+        base_estimate = int(self.w3.eth.estimate_gas(tx))
+        return _pad_gas(base_estimate, strategy)
 
     def _finalize_fee_fields(self, tx: dict) -> dict:
         """
@@ -87,21 +188,29 @@ class TxService:
     def _build_tx_dict(self, fn: ContractFunction, value_wei: int) -> dict:
         """
         Builds the bare transaction dict with from/nonce/value but no gas limit yet.
+
+        A provisional "gas" is passed so web3 does not run its own eth_estimateGas:
+        the limit is always recomputed by the caller (explicit or _estimate_with_strategy).
         """
         base_tx = {
             "from":  self.account.address,
             "nonce": self._next_nonce(),
             "value": int(value_wei or 0),
+            "gas": _PROVISIONAL_GAS,
         }
-        return fn.build_transaction(base_tx)
+        tx = fn.build_transaction(base_tx)
+        tx.pop("gas", None)
+        return tx
 
     def _sign_and_send(self, tx: dict) -> str:
-        signed = self.w3.eth.account.sign_transaction(tx, self.pk)
-        txh = self.w3.eth.send_raw_transaction(signed.raw_transaction)
-        return txh.hex()
+        return self._broadcast(tx)
 
-    def _wait_receipt(self, tx_hash: str) -> dict:
-        rcpt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+    def _wait_receipt(self, tx_hash: str, poll: ReceiptPollCfg = DEFAULT_RECEIPT_POLL) -> dict:
+        rcpt = self.w3.eth.wait_for_transaction_receipt(
+            HexBytes(tx_hash),
+            timeout=poll.timeout_s,
+            poll_latency=poll.poll_latency_s,
+        )
         return dict(rcpt)
 
     def _budget_check(
@@ -131,7 +240,7 @@ class TxService:
                 usd_budget=float(max_gas_usd),
             )
 
-        gas_cost_eth = (Decimal(gas_limit) * Decimal(gas_price_wei)) / Decimal(10**18)
+        gas_cost_eth = (Decimal(gas_limit) * Decimal(gas_price_wei)) / _WEI_PER_ETH
         gas_cost_usd = float(gas_cost_eth * Decimal(eth_usd_hint))
         budget.usd_estimated_upper_bound = gas_cost_usd
 
@@ -164,7 +273,7 @@ class TxService:
 
         cost_eth = None
         if gas_used and eff_price_wei:
-            cost_eth = float((Decimal(gas_used) * Decimal(eff_price_wei)) / Decimal(10**18))
+            cost_eth = float((Decimal(gas_used) * Decimal(eff_price_wei)) / _WEI_PER_ETH)
 
         return to_json_safe(
             {
@@ -198,6 +307,7 @@ class TxService:
         gas_strategy: GasStrategy = GasStrategy.BUFFERED,
         max_gas_usd: Optional[float] = None,
         eth_usd_hint: Optional[float] = None,
+        receipt_poll: ReceiptPollCfg = DEFAULT_RECEIPT_POLL,
     ) -> dict:
         """
         Broadcasts a state-changing transaction on-chain for a given contract function.
@@ -216,6 +326,8 @@ class TxService:
                 Caller-supplied price of 1 ETH in USD (float).
                 Ex: se pool tiver par WETH/USDC você já sabe o preço.
                 Required if you pass max_gas_usd, otherwise we can't price it.
+            receipt_poll:
+                Receipt polling interval/timeout used when wait=True.
 
         Returns (on success OR if wait=False broadcasted ok):
             {
@@ -274,7 +386,7 @@ class TxService:
                 budget=budget,
             )
 
-        rcpt = self._wait_receipt(tx_hash)
+        rcpt = self._wait_receipt(tx_hash, receipt_poll)
         status = int(rcpt.get("status", 0))
 
         if status == 0:
@@ -307,6 +419,7 @@ class TxService:
         value: int = 0,
         max_gas_usd: Optional[float] = None,
         eth_usd_hint: Optional[float] = None,
+        receipt_poll: ReceiptPollCfg = DEFAULT_RECEIPT_POLL,
     ) -> dict:
         ContractFactory = self.w3.eth.contract(abi=abi, bytecode=bytecode)
 
@@ -315,23 +428,21 @@ class TxService:
                 "from": self.account.address,
                 "nonce": self._next_nonce(),
                 "value": int(value or 0),
+                "gas": _PROVISIONAL_GAS,
             }
         )
+        build_tx.pop("gas", None)
 
         if gas_limit is not None:
             final_gas_limit = int(gas_limit)
         else:
-            try:
-                base_estimate = int(self.w3.eth.estimate_gas(build_tx))
-            except Exception:
-                base_estimate = 500_000
-
-            if gas_strategy == "default":
-                final_gas_limit = base_estimate
-            elif gas_strategy == "buffered":
-                final_gas_limit = int(base_estimate * 1.25) + 10_000
-            else:
-                final_gas_limit = int(base_estimate * 1.5) + 25_000
+            base_estimate = int(self.w3.eth.estimate_gas(build_tx))
+
+            # deploy keeps its historic behaviour: unknown strategies pad like "aggressive"
+            final_gas_limit = _pad_gas(
+                base_estimate,
+                gas_strategy if gas_strategy in ("default", "buffered") else "aggressive",
+            )
 
         build_tx["gas"] = final_gas_limit
 
@@ -346,9 +457,7 @@ class TxService:
             eth_usd_hint=eth_usd_hint,
         )
 
-        signed = self.w3.eth.account.sign_transaction(build_tx, self.pk)
-        txh = self.w3.eth.send_raw_transaction(signed.raw_transaction)
-        tx_hash = txh.hex()
+        tx_hash = self._broadcast(build_tx)
 
         if not wait:
             base = self._base_response(
@@ -363,7 +472,7 @@ class TxService:
             base["result"] = {"contract_address": None}
             return to_json_safe(base)
 
-        rcpt = dict(self.w3.eth.wait_for_transaction_receipt(txh))
+        rcpt = self._wait_receipt(tx_hash, receipt_poll)
         status = int(rcpt.get("status", 0))
 
         if status == 0:
@@ -385,3 +494,14 @@ class TxService:
         )
         base["result"] = {"contract_address": rcpt.get("contractAddress")}
         return to_json_safe(base)
+
+
+@lru_cache(maxsize=32)
+def get_tx_service(rpc_url: str | None = None) -> TxService:
+    """
+    Shared TxService per rpc_url (None => settings.RPC_URL_DEFAULT).
+
+    TxService holds no per-request state (nonce tracking is module level), so one
+    instance per endpoint is enough and reuses its Web3 / keep-alive session.
+    """
+    return TxService((rpc_url or "").strip() or None)
@@ -1,9 +1,22 @@
 # core/services/utils.py
-from typing import Any
+from decimal import Decimal
+from typing import Any, Tuple
 from collections.abc import Mapping, Iterable
 from hexbytes import HexBytes
 from web3 import Web3
 
+# 10**d for every ERC20 decimals value (uint8): token amount scaling without a pow per call.
+POW10: Tuple[int, ...] = tuple(10 ** i for i in range(256))
+
+
+def raw_to_human(amount_raw: int, decimals: int) -> float:
+    """
+    Raw token units -> human float, exact until the final cast
+    (float(raw) / 10**d silently drops precision above 2**53).
+    """
+    return float(Decimal(int(amount_raw)) / POW10[int(decimals)])
+
+
 def to_json_safe(obj: Any) -> Any:
     """
     Recursively convert web3 / HexBytes-heavy structures into plain JSON-serializable primitives.
@@ -2,16 +2,19 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from decimal import Decimal, getcontext
+from functools import lru_cache
 from time import perf_counter, time
 from typing import Dict, List, Tuple, Optional, Any
 
 from hexbytes import HexBytes
-import requests
 from web3 import Web3
 from web3.contract import Contract
 
 from config import get_settings
 from adapters.chain.client_vault import ClientVaultAdapter
+from core.services.erc20_meta import erc20_meta_calls, get_erc20_meta, set_erc20_meta
+from core.services.rpc_batch import CallSpec as _CallSpec, batch_eth_call
+from core.services.utils import POW10, raw_to_human
 from core.domain.schemas.onchain_types import (
     Erc20Meta,
     FeesUncollectedOut,
@@ -29,12 +32,10 @@ Q96 = Decimal(2) ** 96
 U128_MAX = (1 << 128) - 1
 ZERO_ADDR = "0x0000000000000000000000000000000000000000"
 
-USD_SYMBOLS = {"USDC", "USDT", "DAI", "USD+", "USDB", "USDE"}
+USD_SYMBOLS = frozenset({"USDC", "USDT", "DAI", "USD+", "USDB", "USDE"})
 
 # ----------------- caches -----------------
 
-_TOKEN_META_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
-_TOKEN_META_TTL_SEC = 24 * 60 * 60
 
 _VAULT_STATIC_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
 _VAULT_STATIC_TTL_SEC = 10 * 60  # 10 minutes
@@ -101,12 +102,6 @@ def _to_checksum(addr_any: Any) -> str:
     return s
 
  
-@dataclass
-class _CallSpec:
-    to: str
-    data: str
-    out_types: List[str]
-
 
 def _enc(contract: Contract, fn: str, args: Optional[list] = None) -> str:
     """
@@ -121,6 +116,40 @@ def _enc(contract: Contract, fn: str, args: Optional[list] = None) -> str:
     return contract.encodeABI(fn_name=fn, args=args)
 
 
+def _selector(signature: str) -> str:
+    return "0x" + Web3.keccak(text=signature)[:4].hex()
+
+
+# Pre-encoded calldata for no-arg views: skips ABI lookup + encoding on every eth_call.
+# Decoding only the leading words keeps slot0 compatible with Pancake/Uniswap (7 fields)
+# and Slipstream (6 fields).
+SEL_SLOT0 = _selector("slot0()")
+SEL_TICK_SPACING = _selector("tickSpacing()")
+SEL_FEE = _selector("fee()")
+SEL_TOKEN0 = _selector("token0()")
+SEL_TOKEN1 = _selector("token1()")
+SEL_CAKE = _selector("CAKE()")
+SEL_REWARD_TOKEN = _selector("rewardToken()")
+SEL_POSITION_TOKEN_ID = _selector("positionTokenId()")
+SEL_LAST_REBALANCE_TS = _selector("lastRebalanceTs()")
+
+# ERC20 balanceOf 0x70a08231 (decimals/symbol live with the shared meta cache)
+SEL_ERC20_BALANCE_OF = _selector("balanceOf(address)")
+
+
+def _set_token_meta_cached(*, chain: str, token_addr: str, res: List[Optional[Any]]) -> Tuple[int, str]:
+    """Caches decimals/symbol decoded from erc20_meta_calls results (18/"TKN" for display on failure)."""
+    meta = set_erc20_meta(chain, token_addr, res)
+    if meta is None:
+        return 18, "TKN"
+    return meta[0], meta[1] or "TKN"
+
+
+def _balance_of_data(owner: str) -> str:
+    """balanceOf(owner) calldata: selector + left-padded 32-byte address word."""
+    return SEL_ERC20_BALANCE_OF + owner.lower().removeprefix("0x").rjust(64, "0")
+
+
 ABI_ERC20 = [
     {"name": "decimals", "outputs": [{"type": "uint8"}], "inputs": [], "stateMutability": "view", "type": "function"},
     {"name": "symbol", "outputs": [{"type": "string"}], "inputs": [], "stateMutability": "view", "type": "function"},
@@ -214,72 +243,124 @@ ABI_V3_POOL_MIN = [
     },
 ]
 
+_ABI_BY_KIND: Dict[str, list] = {
+    "erc20": ABI_ERC20,
+    "nfpm": ABI_NFPM,
+    "v3_pool": ABI_V3_POOL_MIN,
+    "gauge": ABI_GAUGE_MIN,
+    "masterchef": ABI_PANCAKE_MASTERCHEF_MIN,
+}
+
+
+# (endpoint_uri, address, abi kind) -> contract bound to that endpoint's current Web3
+_CONTRACT_CACHE: Dict[Tuple[str, str, str], Contract] = {}
+
+
+def _contract_at(w3: Web3, addr: str, kind: str) -> Contract:
+    """
+    Contract objects per (endpoint, address, abi kind), so the ABI function table
+    is not rebuilt per request. Keyed on the endpoint rather than the Web3 instance:
+    get_web3 rotates instances every _W3_TTL_SEC, and an entry built on an older
+    instance is rebuilt on first use, dropping that endpoint's other stale entries
+    so they do not keep the old Web3/HTTPProvider alive.
+    """
+    endpoint = str(getattr(w3.provider, "endpoint_uri", "") or "")
+    key = (endpoint, addr.lower(), kind)
+    c = _CONTRACT_CACHE.get(key)
+    if c is not None and c.w3 is w3:
+        return c
+    if c is not None:
+        for k in [k for k, v in _CONTRACT_CACHE.items() if k[0] == endpoint and v.w3 is not w3]:
+            _CONTRACT_CACHE.pop(k, None)
+    c = w3.eth.contract(address=Web3.to_checksum_address(addr), abi=_ABI_BY_KIND[kind])
+    _CONTRACT_CACHE[key] = c
+    return c
 
 
 # ----------------- helpers -----------------
 
-def _holdings_total_usd(
-    *,
-    token0_amt: float,
-    token1_amt: float,
-    sym0: str,
-    sym1: str,
-    addr0: str,
-    addr1: str,
-    current_block: Dict[str, float],
-) -> Optional[float]:
-    stable0 = _is_usd_symbol(sym0) or _is_stable_addr(addr0)
-    stable1 = _is_usd_symbol(sym1) or _is_stable_addr(addr1)
+def _is_usd_symbol(sym: str) -> bool:
+    return (sym or "").upper() in USD_SYMBOLS
 
+
+def _is_stable_addr(addr: str) -> bool:
     try:
-        p_t1_t0 = float(current_block["p_t1_t0"])  # token1 per token0
-        p_t0_t1 = float(current_block["p_t0_t1"])  # token0 per token1
+        return (addr or "").lower() in get_settings().STABLE_TOKEN_SET
     except Exception:
-        return None
+        return False
 
-    # ambos stable => soma nominal
-    if stable0 and stable1:
-        return float(token0_amt + token1_amt)
 
+# (stable0, stable1) -> (usd per token0, usd per token1), given p_t1_t0 (token1 per token0)
+_USD_PRICES_BY_SIDE = {
+    # ambos stable => soma nominal
+    (True, True): lambda p: (1.0, 1.0),
     # token1 é USD => token0 em USD via p_t1_t0
-    if stable1 and not stable0:
-        return float(token0_amt * p_t1_t0 + token1_amt)
-
+    (False, True): lambda p: (p, 1.0),
     # token0 é USD => token1 em USD via p_t0_t1
-    if stable0 and not stable1:
-        return float(token1_amt * p_t0_t1 + token0_amt)
+    (True, False): lambda p: (1.0, float("inf") if p == 0 else 1.0 / p),
+}
 
-    # nenhum stable => sem âncora USD
-    return None
 
+def _derive_usd_prices(
+    *,
+    sym0: str,
+    sym1: str,
+    addr0: str,
+    addr1: str,
+    p_t1_t0: float,
+) -> Optional[Tuple[float, float]]:
+    """
+    Resolve the USD price of each pool token from the stable side of the pair.
 
-def _is_usd_symbol(sym: str) -> bool:
-    return (sym or "").upper() in USD_SYMBOLS
+    Returns (usd_per_token0, usd_per_token1) or None when neither token is a USD anchor.
+    """
+    side = (
+        _is_usd_symbol(sym0) or _is_stable_addr(addr0),
+        _is_usd_symbol(sym1) or _is_stable_addr(addr1),
+    )
+    fn = _USD_PRICES_BY_SIDE.get(side)
+    if fn is None:
+        return None
+    return fn(float(p_t1_t0))
 
 
-def _is_stable_addr(addr: str) -> bool:
-    s = get_settings()
-    try:
-        return (addr or "").lower() in {a.lower() for a in (s.STABLE_TOKEN_ADDRESSES or [])}
-    except Exception:
-        return False
+def _holdings_total_usd(
+    *,
+    token0_amt: float,
+    token1_amt: float,
+    usd_prices: Optional[Tuple[float, float]],
+) -> Optional[float]:
+    if usd_prices is None:
+        return None
+    usd0, usd1 = usd_prices
+    return float(token0_amt * usd0 + token1_amt * usd1)
 
 
+# Pure Decimal math at prec=90 (fractional powers for ticks): memoized on the int
+# inputs. Position bounds are fixed between rebalances and the current tick/sqrtP
+# repeat across polls, so most status reads hit the cache.
+@lru_cache(maxsize=4096)
 def _sqrtPriceX96_to_price_t1_per_t0(sqrtP: int, dec0: int, dec1: int) -> float:
     ratio = Decimal(sqrtP) / Q96
     px = ratio * ratio
-    scale = Decimal(10) ** (dec0 - dec1)
+    scale = Decimal(POW10[dec0]) / POW10[dec1]
     return float(px * scale)  # token1 per token0 (human)
 
 
-def _prices_from_tick(tick: int, dec0: int, dec1: int) -> Dict[str, float]:
+@lru_cache(maxsize=4096)
+def _p_t1_t0_at_tick(tick: int, dec0: int, dec1: int) -> float:
     # IMPORTANT: human token1/token0 uses 10^(dec0-dec1)
     p_t1_t0 = (Decimal("1.0001") ** Decimal(tick)) * (Decimal(10) ** Decimal(dec0 - dec1))
-    p_t1_t0_f = float(p_t1_t0)
+    return float(p_t1_t0)
+
+
+def _prices_from_tick(tick: int, dec0: int, dec1: int) -> Dict[str, float]:
+    p_t1_t0_f = _p_t1_t0_at_tick(int(tick), int(dec0), int(dec1))
     p_t0_t1_f = float("inf") if p_t1_t0_f == 0 else float(1.0 / p_t1_t0_f)
     return {"tick": int(tick), "p_t1_t0": p_t1_t0_f, "p_t0_t1": p_t0_t1_f}
 
 
+@lru_cache(maxsize=4096)
 def _get_sqrt_ratio_at_tick(tick: int) -> int:
     val = (Decimal("1.0001") ** (Decimal(tick) / 2)) * Q96
     return int(val)
@@ -326,19 +407,19 @@ class VaultStatusService:
     w3: Web3
 
     def _erc20(self, addr: str) -> Contract:
-        return self.w3.eth.contract(address=Web3.to_checksum_address(addr), abi=ABI_ERC20)
+        return _contract_at(self.w3, addr, "erc20")
 
     def _nfpm(self, addr: str) -> Contract:
-        return self.w3.eth.contract(address=Web3.to_checksum_address(addr), abi=ABI_NFPM)
+        return _contract_at(self.w3, addr, "nfpm")
 
     def _v3_pool(self, addr: str) -> Contract:
-        return self.w3.eth.contract(address=Web3.to_checksum_address(addr), abi=ABI_V3_POOL_MIN)
+        return _contract_at(self.w3, addr, "v3_pool")
 
     def _gauge_generic(self, addr: str) -> Contract:
-        return self.w3.eth.contract(address=Web3.to_checksum_address(addr), abi=ABI_GAUGE_MIN)
+        return _contract_at(self.w3, addr, "gauge")
 
     def _pancake_masterchef(self, addr: str) -> Contract:
-        return self.w3.eth.contract(address=Web3.to_checksum_address(addr), abi=ABI_PANCAKE_MASTERCHEF_MIN)
+        return _contract_at(self.w3, addr, "masterchef")
 
     # ----------------- batch eth_call -----------------
 
@@ -347,87 +428,18 @@ class VaultStatusService:
         Batch JSON-RPC eth_call. Falls back to sequential eth_call if batch unsupported.
         Returns decoded values (single output => value, multi => tuple), None on error per-call.
         """
-        if not calls:
-            return []
-
-        endpoint = getattr(self.w3.provider, "endpoint_uri", None)
-        payload = []
-        for i, c in enumerate(calls):
-            payload.append(
-                {
-                    "jsonrpc": "2.0",
-                    "id": i + 1,
-                    "method": "eth_call",
-                    "params": [{"to": Web3.to_checksum_address(c.to), "data": c.data}, "latest"],
-                }
-            )
+        return batch_eth_call(self.w3, calls)
 
-        def _decode(spec: _CallSpec, raw_hex_or_bytes: Any) -> Optional[Any]:
-            try:
-                if raw_hex_or_bytes is None:
-                    return None
-                if isinstance(raw_hex_or_bytes, (bytes, bytearray, HexBytes)):
-                    raw = HexBytes(raw_hex_or_bytes)
-                else:
-                    raw = HexBytes(raw_hex_or_bytes)
-                decoded = self.w3.codec.decode(spec.out_types, raw)  # type: ignore[attr-defined]
-                if len(spec.out_types) == 1:
-                    return decoded[0]
-                return tuple(decoded)
-            except Exception:
-                return None
-
-        # try batch
-        if endpoint:
-            try:
-                r = requests.post(endpoint, json=payload, timeout=12)
-                data = r.json()
-                if isinstance(data, list):
-                    by_id = {it.get("id"): it for it in data if isinstance(it, dict)}
-                    out: List[Optional[Any]] = []
-                    for i, spec in enumerate(calls):
-                        it = by_id.get(i + 1) or {}
-                        if "error" in it:
-                            out.append(None)
-                            continue
-                        out.append(_decode(spec, it.get("result")))
-                    return out
-            except Exception:
-                pass
-
-        # fallback sequential
-        out2: List[Optional[Any]] = []
-        for spec in calls:
-            try:
-                raw = self.w3.eth.call({"to": Web3.to_checksum_address(spec.to), "data": spec.data})
-                out2.append(_decode(spec, raw))
-            except Exception:
-                out2.append(None)
-        return out2
-    
     # ----------------- meta caches -----------------
 
     def _get_token_meta_cached(self, *, chain: str, token_addr: str, timings: Dict[str, float], debug_timing: bool) -> Tuple[int, str]:
-        key = f"{chain}:{token_addr.lower()}"
-        hit = _cache_get(_TOKEN_META_CACHE, key, _TOKEN_META_TTL_SEC)
+        hit = get_erc20_meta(chain, token_addr)
         if hit:
-            return int(hit["decimals"]), str(hit["symbol"])
+            return hit[0], hit[1] or "TKN"
 
         t = perf_counter()
-        erc = self._erc20(token_addr)
-
-        dec = 18
-        sym = "TKN"
-        try:
-            dec = int(erc.functions.decimals().call())
-        except Exception:
-            dec = 18
-        try:
-            sym = str(erc.functions.symbol().call())
-        except Exception:
-            sym = "TKN"
-
-        _cache_set(_TOKEN_META_CACHE, key, {"decimals": int(dec), "symbol": str(sym)})
+        res = self._rpc_batch_call(erc20_meta_calls(token_addr))
+        dec, sym = _set_token_meta_cached(chain=chain, token_addr=token_addr, res=res)
 
         if debug_timing:
             timings.setdefault("token_meta_cache_miss_calls", 0.0)
@@ -583,10 +595,9 @@ class VaultStatusService:
         t1 = meta.get("token1") if meta else None
 
         if not t0 or not t1:
-            pool = self._v3_pool(pool_addr)
             calls = [
-                _CallSpec(to=pool_addr, data=_enc(pool, "token0"), out_types=["address"]),
-                _CallSpec(to=pool_addr, data=_enc(pool, "token1"), out_types=["address"]),
+                _CallSpec(to=pool_addr, data=SEL_TOKEN0, out_types=["address"]),
+                _CallSpec(to=pool_addr, data=SEL_TOKEN1, out_types=["address"]),
             ]
             r0, r1 = self._rpc_batch_call(calls)
             t0 = _to_checksum(r0) if r0 is not None else ZERO_ADDR
@@ -598,14 +609,9 @@ class VaultStatusService:
         sqrtP = int(slot["sqrtP"]) if slot and "sqrtP" in slot else None
 
         if sqrtP is None:
-            pool = self._v3_pool(pool_addr)
             t_slot = perf_counter()
             res = self._rpc_batch_call([
-                _CallSpec(
-                    to=pool_addr,
-                    data=_enc(pool, "slot0"),
-                    out_types=["uint160", "int24", "uint16", "uint16", "uint16", "uint32", "bool"],
-                )
+                _CallSpec(to=pool_addr, data=SEL_SLOT0, out_types=["uint160", "int24"])
             ])
             if debug_timing:
                 timings.setdefault("gauge_reward_usd_est_slot0_call", 0.0)
@@ -621,6 +627,29 @@ class VaultStatusService:
         if sqrtP is None:
             return None
 
+        return self._reward_usd_est_core(
+            chain=chain,
+            t0=t0,
+            t1=t1,
+            sqrtP=sqrtP,
+            pending_amount=pending_amount,
+            reward_token_addr=reward_token_addr,
+        )
+
+    def _reward_usd_est_core(
+        self,
+        *,
+        chain: str,
+        t0: str,
+        t1: str,
+        sqrtP: int,
+        pending_amount: float,
+        reward_token_addr: str,
+    ) -> Optional[float]:
+        """
+        Prices the pending reward from an already-known pool state (tokens + sqrtP).
+        No pool reads: callers that already hold slot0 for the swap pool skip them.
+        """
         # token metas (cached globally)
         dec0, sym0 = self._get_token_meta_cached(chain=chain, token_addr=t0, timings={}, debug_timing=False)
         dec1, sym1 = self._get_token_meta_cached(chain=chain, token_addr=t1, timings={}, debug_timing=False)
@@ -631,6 +660,7 @@ class VaultStatusService:
         t0c = Web3.to_checksum_address(t0)
         t1c = Web3.to_checksum_address(t1)
 
+        # priced from the opposite (stable) side only; 0.0 rather than inf when p == 0
         price_reward_usd: Optional[float] = None
         if reward == t0c and (_is_usd_symbol(sym1) or _is_stable_addr(t1c)):
             price_reward_usd = float(p_t1_t0)
@@ -698,17 +728,6 @@ class VaultStatusService:
         executor = filled.get("executor") or ZERO_ADDR
         fee_collector = filled.get("fee_collector") or ZERO_ADDR
 
-        position_token_id = 0
-        last_rebalance_ts = 0
-        try:
-            position_token_id = int(vault.position_token_id())
-        except Exception:
-            position_token_id = 0
-        try:
-            last_rebalance_ts = int(vault.last_rebalance_ts())
-        except Exception:
-            last_rebalance_ts = 0
-
         mark("vault_reads", t)
 
         # ---------- adapter_reads (pool slot0 + tokens if missing) ----------
@@ -722,29 +741,63 @@ class VaultStatusService:
             gauge = ZERO_ADDR
         adapter_addr = Web3.to_checksum_address(adapter_addr)
 
-        poolc = self._v3_pool(pool_addr)
-        slot0 = poolc.functions.slot0().call()
+        token0_addr = st.get("token0")
+        token1_addr = st.get("token1")
+        need_tokens = not token0_addr or not token1_addr
+
+        # one batch with pre-encoded selectors: vault position reads + pool slot0/tickSpacing
+        # (+ token0/token1 if missing), all independent so they share a single round trip
+        pool_calls = [
+            _CallSpec(to=pool_addr, data=SEL_SLOT0, out_types=["uint160", "int24"]),
+            _CallSpec(to=pool_addr, data=SEL_TICK_SPACING, out_types=["int24"]),
+            _CallSpec(to=vault_address, data=SEL_POSITION_TOKEN_ID, out_types=["uint256"]),
+            _CallSpec(to=vault_address, data=SEL_LAST_REBALANCE_TS, out_types=["uint256"]),
+        ]
+        if need_tokens:
+            pool_calls.append(_CallSpec(to=pool_addr, data=SEL_TOKEN0, out_types=["address"]))
+            pool_calls.append(_CallSpec(to=pool_addr, data=SEL_TOKEN1, out_types=["address"]))
+
+        # tokens already known (static cache): idle balances and missing ERC20 meta ride
+        # in the same batch instead of costing their own round trips further down
+        bal_idx = -1
+        meta_idx: Dict[str, int] = {}
+        if not need_tokens:
+            bal_idx = len(pool_calls)
+            pool_calls.append(_CallSpec(to=token0_addr, data=_balance_of_data(vault_address), out_types=["uint256"]))
+            pool_calls.append(_CallSpec(to=token1_addr, data=_balance_of_data(vault_address), out_types=["uint256"]))
+            for tok in (token0_addr, token1_addr):
+                tok_l = tok.lower()
+                if tok_l in meta_idx or get_erc20_meta(chain, tok_l):
+                    continue
+                meta_idx[tok_l] = len(pool_calls)
+                pool_calls.extend(erc20_meta_calls(tok))
+
+        res_pool = self._rpc_batch_call(pool_calls)
+
+        prefetched_bal0 = prefetched_bal1 = None
+        if bal_idx >= 0:
+            if res_pool[bal_idx] is not None:
+                prefetched_bal0 = int(res_pool[bal_idx])
+            if res_pool[bal_idx + 1] is not None:
+                prefetched_bal1 = int(res_pool[bal_idx + 1])
+        for tok_l, i in meta_idx.items():
+            _set_token_meta_cached(chain=chain, token_addr=tok_l, res=res_pool[i:i + 2])
+
+        position_token_id = int(res_pool[2]) if res_pool[2] is not None else 0
+        last_rebalance_ts = int(res_pool[3]) if res_pool[3] is not None else 0
+
+        slot0 = res_pool[0]
+        if slot0 is None:
+            # surface the real RPC/ABI error
+            slot0 = self._v3_pool(pool_addr).functions.slot0().call()
         sqrt_price_x96 = int(slot0[0])
         tick = int(slot0[1])
 
-        tick_spacing = 0
-        try:
-            tick_spacing = int(poolc.functions.tickSpacing().call())
-        except Exception:
-            tick_spacing = 0
+        tick_spacing = int(res_pool[1]) if res_pool[1] is not None else 0
 
-        token0_addr = st.get("token0")
-        token1_addr = st.get("token1")
-
-        if not token0_addr or not token1_addr:
-            try:
-                token0_addr = Web3.to_checksum_address(poolc.functions.token0().call())
-            except Exception:
-                token0_addr = ZERO_ADDR
-            try:
-                token1_addr = Web3.to_checksum_address(poolc.functions.token1().call())
-            except Exception:
-                token1_addr = ZERO_ADDR
+        if need_tokens:
+            token0_addr = _to_checksum(res_pool[4]) if res_pool[4] is not None else ZERO_ADDR
+            token1_addr = _to_checksum(res_pool[5]) if res_pool[5] is not None else ZERO_ADDR
         else:
             token0_addr = Web3.to_checksum_address(token0_addr)
             token1_addr = Web3.to_checksum_address(token1_addr)
@@ -875,14 +928,12 @@ class VaultStatusService:
 
         # ---------- idle balances (batch + cache) ----------
         t = perf_counter()
-        e0 = self._erc20(token0_addr)
-        e1 = self._erc20(token1_addr)
 
         # bal0_idle_raw = self._get_erc20_balance_cached(chain=chain, token=token0_addr, owner=vault_address, fresh_onchain=fresh_onchain)
         # bal1_idle_raw = self._get_erc20_balance_cached(chain=chain, token=token1_addr, owner=vault_address, fresh_onchain=fresh_onchain)
 
-        bal0_idle_raw = None
-        bal1_idle_raw = None
+        bal0_idle_raw = prefetched_bal0
+        bal1_idle_raw = prefetched_bal1
 
         calls_bal: List[_CallSpec] = []
         idx0 = idx1 = -1
@@ -891,14 +942,14 @@ class VaultStatusService:
             idx0 = len(calls_bal)
             calls_bal.append(_CallSpec(
                 to=token0_addr,
-                data=_enc(e0, "balanceOf", [Web3.to_checksum_address(vault_address)]),
+                data=_balance_of_data(vault_address),
                 out_types=["uint256"],
             ))
         if bal1_idle_raw is None:
             idx1 = len(calls_bal)
             calls_bal.append(_CallSpec(
                 to=token1_addr,
-                data=_enc(e1, "balanceOf", [Web3.to_checksum_address(vault_address)]),
+                data=_balance_of_data(vault_address),
                 out_types=["uint256"],
             ))
 
@@ -920,8 +971,8 @@ class VaultStatusService:
         if bal1_idle_raw is None:
             bal1_idle_raw = 0
 
-        vault_idle0 = float(Decimal(int(bal0_idle_raw)) / (Decimal(10) ** dec0))
-        vault_idle1 = float(Decimal(int(bal1_idle_raw)) / (Decimal(10) ** dec1))
+        vault_idle0 = raw_to_human(bal0_idle_raw, dec0)
+        vault_idle1 = raw_to_human(bal1_idle_raw, dec1)
         mark("idle_balances", t)
 
         # ---------- in-position math ----------
@@ -932,8 +983,8 @@ class VaultStatusService:
             sqrtA = _get_sqrt_ratio_at_tick(lower_tick)
             sqrtB = _get_sqrt_ratio_at_tick(upper_tick)
             amt0_raw, amt1_raw = _get_amounts_for_liquidity(sqrt_price_x96, sqrtA, sqrtB, liquidity)
-            inpos0 = float(Decimal(amt0_raw) / (Decimal(10) ** dec0))
-            inpos1 = float(Decimal(amt1_raw) / (Decimal(10) ** dec1))
+            inpos0 = raw_to_human(amt0_raw, dec0)
+            inpos1 = raw_to_human(amt1_raw, dec1)
         totals0 = vault_idle0 + inpos0
         totals1 = vault_idle1 + inpos1
         mark("in_position_math", t)
@@ -944,35 +995,16 @@ class VaultStatusService:
         lower_block = _prices_from_tick(lower_tick, dec0, dec1) if position_token_id else current_block
         upper_block = _prices_from_tick(upper_tick, dec0, dec1) if position_token_id else current_block
         
-        vault_idle_usd = _holdings_total_usd(
-            token0_amt=float(vault_idle0),
-            token1_amt=float(vault_idle1),
-            sym0=str(sym0),
-            sym1=str(sym1),
-            addr0=Web3.to_checksum_address(token0_addr),
-            addr1=Web3.to_checksum_address(token1_addr),
-            current_block=current_block,
-        )
-
-        inpos_usd = _holdings_total_usd(
-            token0_amt=float(inpos0),
-            token1_amt=float(inpos1),
-            sym0=str(sym0),
-            sym1=str(sym1),
-            addr0=Web3.to_checksum_address(token0_addr),
-            addr1=Web3.to_checksum_address(token1_addr),
-            current_block=current_block,
-        )
-
-        totals_usd = _holdings_total_usd(
-            token0_amt=float(totals0),
-            token1_amt=float(totals1),
+        usd_prices = _derive_usd_prices(
             sym0=str(sym0),
             sym1=str(sym1),
-            addr0=Web3.to_checksum_address(token0_addr),
-            addr1=Web3.to_checksum_address(token1_addr),
-            current_block=current_block,
+            addr0=token0_addr,
+            addr1=token1_addr,
+            p_t1_t0=float(current_block["p_t1_t0"]),
         )
+        vault_idle_usd = _holdings_total_usd(token0_amt=float(vault_idle0), token1_amt=float(vault_idle1), usd_prices=usd_prices)
+        inpos_usd = _holdings_total_usd(token0_amt=float(inpos0), token1_amt=float(inpos1), usd_prices=usd_prices)
+        totals_usd = _holdings_total_usd(token0_amt=float(totals0), token1_amt=float(totals1), usd_prices=usd_prices)
 
         mark("prices_calc", t)
 
@@ -988,19 +1020,10 @@ class VaultStatusService:
 
         # ---------- fees ----------
         t = perf_counter()
-        fees0_h = float(Decimal(int(fees0_raw)) / (Decimal(10) ** dec0))
-        fees1_h = float(Decimal(int(fees1_raw)) / (Decimal(10) ** dec1))
+        fees0_h = raw_to_human(fees0_raw, dec0)
+        fees1_h = raw_to_human(fees1_raw, dec1)
 
-        fees_usd: Optional[float] = None
-        try:
-            p_t1_t0 = float(current_block["p_t1_t0"])
-            if _is_usd_symbol(sym1) or _is_stable_addr(token1_addr):
-                fees_usd = float(fees0_h * p_t1_t0 + fees1_h)
-            elif _is_usd_symbol(sym0) or _is_stable_addr(token0_addr):
-                p_t0_t1 = float(current_block["p_t0_t1"])
-                fees_usd = float(fees1_h * p_t0_t1 + fees0_h)
-        except Exception:
-            fees_usd = None
+        fees_usd = _holdings_total_usd(token0_amt=fees0_h, token1_amt=fees1_h, usd_prices=usd_prices)
         mark("fees_calc", t)
 
         # ---------- gauge rewards (batch + caches) ----------
@@ -1042,7 +1065,7 @@ class VaultStatusService:
                     ]
                     need_cake = not (cached_reward and Web3.is_address(cached_reward))
                     if need_cake:
-                        calls.append(_CallSpec(to=gauge, data=_enc(mc, "CAKE"), out_types=["address"]))
+                        calls.append(_CallSpec(to=gauge, data=SEL_CAKE, out_types=["address"]))
                     
                     res = self._rpc_batch_call(calls)
                     if res and res[0] is not None:
@@ -1068,13 +1091,25 @@ class VaultStatusService:
                     if debug_timing:
                         timings["gauge_reward_meta"] = (perf_counter() - t2) * 1000.0
 
-                    pending_h = float(pending_raw) / (10 ** int(reward_dec))
+                    pending_h = raw_to_human(pending_raw, reward_dec)
 
                     if _is_usd_symbol(reward_symbol) or _is_stable_addr(reward_token_addr):
                         pending_usd_est = float(pending_h)
                     else:
                         t2 = perf_counter()
-                        if reward_swap_pool:
+                        if reward_swap_pool and pending_h > 0 and Web3.to_checksum_address(reward_swap_pool) == pool_addr:
+                            # reward swap pool is the vault pool: price from the slot0 read above
+                            pending_usd_est = self._reward_usd_est_core(
+                                chain=chain,
+                                t0=token0_addr,
+                                t1=token1_addr,
+                                sqrtP=sqrt_price_x96,
+                                pending_amount=pending_h,
+                                reward_token_addr=reward_token_addr,
+                            )
+                            if debug_timing:
+                                timings["gauge_reward_usd_est"] = (perf_counter() - t2) * 1000.0
+                        elif reward_swap_pool:
                             pending_usd_est = self._pancake_reward_usd_est_cached(
                                 chain=chain,
                                 reward_swap_pool=reward_swap_pool,
@@ -1093,7 +1128,7 @@ class VaultStatusService:
                     # batch: rewardToken + earned
                     t2 = perf_counter()
                     calls = [
-                        _CallSpec(to=gauge, data=_enc(g, "rewardToken"), out_types=["address"]),
+                        _CallSpec(to=gauge, data=SEL_REWARD_TOKEN, out_types=["address"]),
                         _CallSpec(to=gauge, data=_enc(g, "earned", [Web3.to_checksum_address(adapter_addr), int(position_token_id)]), out_types=["uint256"]),
                     ]
                     res = self._rpc_batch_call(calls)
@@ -1114,7 +1149,7 @@ class VaultStatusService:
                     if debug_timing:
                         timings["gauge_reward_meta"] = (perf_counter() - t2) * 1000.0
 
-                    pending_h = float(pending_raw) / (10 ** int(reward_dec))
+                    pending_h = raw_to_human(pending_raw, reward_dec)
                     if _is_usd_symbol(reward_symbol) or _is_stable_addr(reward_token_addr):
                         pending_usd_est = float(pending_h)
 
@@ -1132,18 +1167,17 @@ class VaultStatusService:
                     in_vault_raw = self._get_erc20_balance_cached(chain=chain, token=reward_token_addr, owner=vault_address, fresh_onchain=fresh_onchain)
 
                     if in_vault_raw is None:
-                        erc_r = self._erc20(reward_token_addr)
                         resb = self._rpc_batch_call([
                             _CallSpec(
                                 to=reward_token_addr,
-                                data=_enc(erc_r, "balanceOf", [Web3.to_checksum_address(vault_address)]),
+                                data=_balance_of_data(vault_address),
                                 out_types=["uint256"],
                             )
                         ])
                         in_vault_raw = int(resb[0]) if resb and resb[0] is not None else 0
                         self._set_erc20_balance_cached(chain=chain, token=reward_token_addr, owner=vault_address, bal=in_vault_raw)
 
-                    in_vault = float(int(in_vault_raw)) / (10 ** int(reward_dec))
+                    in_vault = raw_to_human(in_vault_raw, reward_dec)
                     if debug_timing:
                         timings["gauge_reward_balanceOf"] = (perf_counter() - t2) * 1000.0
 
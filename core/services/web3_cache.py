@@ -5,12 +5,40 @@ from __future__ import annotations
 from time import time
 from typing import Dict, Tuple
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web3 import Web3
 from web3.providers.rpc import HTTPProvider
 
 _W3_CACHE: Dict[str, Tuple[float, Web3]] = {}
 _W3_TTL_SEC = 10 * 60  # 10 minutes
 
+_HTTP_SESSION_CACHE: Dict[str, requests.Session] = {}
+_HTTP_POOL_MAXSIZE = 32
+
+# Retry only failures where the request never reached the node (connect errors),
+# so a JSON-RPC POST such as eth_sendRawTransaction is never replayed.
+_HTTP_RETRY = Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.2)
+
+
+def get_http_session(rpc_url: str) -> requests.Session:
+    """
+    Shared keep-alive requests.Session per rpc_url.
+
+    Used by the web3 HTTPProvider and by raw JSON-RPC batch posts so both reuse
+    the same TCP/TLS connections instead of opening a new one per call.
+    """
+    url = (rpc_url or "").strip()
+    sess = _HTTP_SESSION_CACHE.get(url)
+    if sess is None:
+        sess = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=_HTTP_POOL_MAXSIZE, max_retries=_HTTP_RETRY)
+        sess.mount("http://", adapter)
+        sess.mount("https://", adapter)
+        _HTTP_SESSION_CACHE[url] = sess
+    return sess
+
 
 def get_web3(rpc_url: str) -> Web3:
     """
@@ -25,6 +53,6 @@ def get_web3(rpc_url: str) -> Web3:
     if hit and (now - hit[0]) < _W3_TTL_SEC:
         return hit[1]
 
-    w3 = Web3(HTTPProvider(url, request_kwargs={"timeout": 30}))
+    w3 = Web3(HTTPProvider(url, request_kwargs={"timeout": 30}, session=get_http_session(url)))
     _W3_CACHE[url] = (now, w3)
     return w3
@@ -12,7 +12,7 @@ from core.domain.entities.adapter_registry_entity import AdapterRegistryEntity
 from core.domain.enums.adapter_enums import AdapterStatus
 from core.domain.repositories.adapter_registry_repository_interface import AdapterRegistryRepository
 from core.domain.repositories.dex_pool_repository_interface import DexPoolRepository
-from core.services.tx_service import TxService
+from core.services.tx_service import TxService, get_tx_service
 
 from core.services.normalize import (
     ZERO_ADDRESS,
@@ -61,7 +61,7 @@ class AdminAdaptersUseCase:
             pass
 
         return cls(
-            txs=TxService(s.RPC_URL_DEFAULT),
+            txs=get_tx_service(s.RPC_URL_DEFAULT),
             repo=repo,
             pool_repo=pool_repo,
         )
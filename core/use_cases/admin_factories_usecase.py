@@ -12,7 +12,7 @@ from core.domain.enums.factory_enums import FactoryStatus
 from core.domain.enums.tx_enums import GasStrategy
 from core.domain.repositories.strategy_factory_repository_interface import StrategyRepository
 from core.domain.repositories.vault_factory_repository_interface import VaultFactoryRepository
-from core.services.tx_service import TxService
+from core.services.tx_service import TxService, get_tx_service
 
 
 @dataclass
@@ -38,7 +38,7 @@ class AdminFactoriesUseCase:
             pass
 
         return cls(
-            txs=TxService(s.RPC_URL_DEFAULT),
+            txs=get_tx_service(s.RPC_URL_DEFAULT),
             strategy_repo=strategy_repo,
             vault_repo=vault_repo,
         )
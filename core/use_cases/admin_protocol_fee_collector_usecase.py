@@ -9,7 +9,7 @@ from core.domain.entities.protocol_fee_collector_entity import ProtocolFeeCollec
 from core.domain.enums.factory_enums import FactoryStatus
 from core.domain.enums.tx_enums import GasStrategy
 from core.domain.repositories.protocol_fee_collector_repository_interface import ProtocolFeeCollectorRepository
-from core.services.tx_service import TxService
+from core.services.tx_service import TxService, get_tx_service
 
 
 @dataclass
@@ -33,7 +33,7 @@ class AdminProtocolFeeCollectorUseCase:
             pass
 
         return cls(
-            txs=TxService(s.RPC_URL_DEFAULT),
+            txs=get_tx_service(s.RPC_URL_DEFAULT),
             repo=repo,
         )
 
@@ -9,7 +9,7 @@ from core.domain.entities.vault_fee_buffer_entity import VaultFeeBufferEntity
 from core.domain.enums.factory_enums import FactoryStatus
 from core.domain.enums.tx_enums import GasStrategy
 from core.domain.repositories.vault_fee_buffer_repository_interface import VaultFeeBufferRepository
-from core.services.tx_service import TxService
+from core.services.tx_service import TxService, get_tx_service
 
 
 @dataclass
@@ -33,7 +33,7 @@ class AdminVaultFeeBufferUseCase:
             pass
 
         return cls(
-            txs=TxService(s.RPC_URL_DEFAULT),
+            txs=get_tx_service(s.RPC_URL_DEFAULT),
             repo=repo,
         )
 
@@ -12,7 +12,8 @@ from config import get_settings
 from core.domain.entities.vault_client_registry_entity import VaultRegistryEntity
 from core.domain.repositories.vault_client_registry_repository_interface import VaultRegistryRepositoryInterface
 from core.domain.schemas.auto_harvest_daily_types import AutoHarvestDailyParams
-from core.services.tx_service import TxService
+from core.domain.enums.tx_enums import GasStrategy
+from core.services.tx_service import TxService, get_tx_service
 from core.services.utils import to_json_safe
 
 
@@ -60,9 +61,8 @@ class AutoHarvestCompoundPancakeUseCase:
         return rpc_url or s.RPC_URL_DEFAULT
 
     def _build_w3_and_txs(self, rpc_url: str) -> tuple[Web3, TxService]:
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
-        txs = TxService(rpc_url)
-        return w3, txs
+        txs = get_tx_service(rpc_url)
+        return txs.w3, txs
 
     def harvest_job(
         self,
@@ -74,7 +74,7 @@ class AutoHarvestCompoundPancakeUseCase:
         reward_amount_in: int = 0,
         reward_amount_out_min: int = 0,
         reward_sqrt_price_limit_x96: int = 0,
-        gas_strategy: str = "buffered",
+        gas_strategy: GasStrategy = GasStrategy.BUFFERED,
     ) -> dict:
         """
         Execute the daily harvest job:
@@ -133,7 +133,7 @@ class AutoHarvestCompoundPancakeUseCase:
         compound1_desired: int = 0,
         compound0_min: int = 0,
         compound1_min: int = 0,
-        gas_strategy: str = "buffered",
+        gas_strategy: GasStrategy = GasStrategy.BUFFERED,
     ) -> dict:
         """
         Execute the daily compound job:
@@ -3,6 +3,8 @@ from __future__ import annotations
 from decimal import ROUND_FLOOR, Decimal
 import math
 from dataclasses import dataclass
+from functools import lru_cache
+from time import time
 from typing import Any, Dict, Optional, Tuple
 
 from web3 import Web3
@@ -15,15 +17,15 @@ from config import get_settings
 from core.domain.entities.vault_client_registry_entity import VaultRegistryEntity
 from core.domain.repositories.vault_client_registry_repository_interface import VaultRegistryRepositoryInterface
 from core.domain.schemas.onchain_types import AutoRebalancePancakeParams, PoolMeta, RangeDebug, RangeUsed
-from core.services.tx_service import TxService
-from core.services.utils import to_json_safe
+from core.domain.enums.tx_enums import GasStrategy
+from core.services.erc20_meta import erc20_meta_calls, get_erc20_meta, read_erc20_decimals, set_erc20_meta
+from core.services.rpc_batch import CallSpec, batch_eth_call
+from core.services.tx_service import TxService, get_tx_service
+from core.services.vault_status_service import SEL_FEE, SEL_TICK_SPACING, SEL_TOKEN0, SEL_TOKEN1, _is_usd_symbol
+from core.services.utils import POW10, to_json_safe
+from core.services.web3_cache import get_web3
 
 
-ABI_ERC20_MIN = [
-    {"name": "decimals", "outputs": [{"type": "uint8"}], "inputs": [], "stateMutability": "view", "type": "function"},
-    {"name": "symbol", "outputs": [{"type": "string"}], "inputs": [], "stateMutability": "view", "type": "function"},
-]
-
 ABI_PANCAKE_V3_POOL_MIN = [
     {"name": "token0", "outputs": [{"type": "address"}], "inputs": [], "stateMutability": "view", "type": "function"},
     {"name": "token1", "outputs": [{"type": "address"}], "inputs": [], "stateMutability": "view", "type": "function"},
@@ -32,7 +34,14 @@ ABI_PANCAKE_V3_POOL_MIN = [
 ]
 
 
-USD_SYMBOLS = {"USDC", "USDT", "DAI", "USD+", "USDB", "USDE"}
+@lru_cache(maxsize=256)
+def _pool_contract_at(w3: Web3, pool_addr: str) -> Contract:
+    return w3.eth.contract(address=Web3.to_checksum_address(pool_addr), abi=ABI_PANCAKE_V3_POOL_MIN)
+
+
+# token0/token1/fee/tickSpacing are immutable for a deployed pool
+_POOL_META_CACHE: Dict[str, Tuple[float, PoolMeta]] = {}
+_POOL_META_TTL_SEC = 24 * 60 * 60
 
 
 def _price_to_tick(p_t1_t0: float, dec0: int, dec1: int) -> int:
@@ -47,7 +56,7 @@ def _price_to_tick(p_t1_t0: float, dec0: int, dec1: int) -> int:
         raise ValueError("price must be > 0")
 
     p_raw = float(p_t1_t0) * (10 ** (dec1 - dec0))
-    return int(math.floor(math.log(p_raw) / math.log(1.0001)))
+    return math.floor(math.log(p_raw) / math.log(1.0001))
 
 
 def _align_floor(t: int, spacing: int) -> int:
@@ -60,10 +69,6 @@ def _align_ceil(t: int, spacing: int) -> int:
     return t if r == 0 else t + (spacing - r)
 
 
-def _is_usd(sym: str) -> bool:
-    return (sym or "").upper() in USD_SYMBOLS
-
-
 def _ui_price_to_p_t1_t0(ui_price: float, sym0: str, sym1: str) -> float:
     """
     Convert a UI price (usually 'USD per RISK') into p_t1_t0 (token1 per token0) expected by price->tick.
@@ -73,17 +78,16 @@ def _ui_price_to_p_t1_t0(ui_price: float, sym0: str, sym1: str) -> float:
     - If token0 is USD-like => UI price is p_t0_t1 => invert.
     - Otherwise => assume UI already matches pool convention.
     """
-    if _is_usd(sym1):
+    if _is_usd_symbol(sym1):
         return float(ui_price)
-    if _is_usd(sym0):
+    if _is_usd_symbol(sym0):
         return 1.0 / float(ui_price)
     return float(ui_price)
 
 def _human_to_raw(amount_h: float, decimals: int) -> int:
     if amount_h <= 0:
         return 0
-    q = Decimal(10) ** int(decimals)
-    return int((Decimal(str(amount_h)) * q).to_integral_value(rounding=ROUND_FLOOR))
+    return int((Decimal(str(amount_h)) * POW10[decimals]).to_integral_value(rounding=ROUND_FLOOR))
 
 
 @dataclass
@@ -95,8 +99,8 @@ class AutoRebalancePancakeUseCase:
     @classmethod
     def from_settings(cls) -> "AutoRebalancePancakeUseCase":
         s = get_settings()
-        w3 = Web3(Web3.HTTPProvider(s.RPC_URL_DEFAULT))
-        txs = TxService(s.RPC_URL_DEFAULT)
+        w3 = get_web3(s.RPC_URL_DEFAULT)
+        txs = get_tx_service(s.RPC_URL_DEFAULT)
 
         db = get_mongo_db()
         repo = VaultRegistryRepositoryMongoDB(db=db)
@@ -114,37 +118,54 @@ class AutoRebalancePancakeUseCase:
             raise ValueError(f"Unknown vault alias: {alias}")
         return ent
 
-    def _erc20(self, addr: str) -> Contract:
-        return self.w3.eth.contract(address=Web3.to_checksum_address(addr), abi=ABI_ERC20_MIN)
-
     def _pool_contract(self, pool_addr: str) -> Contract:
-        return self.w3.eth.contract(address=Web3.to_checksum_address(pool_addr), abi=ABI_PANCAKE_V3_POOL_MIN)
-
-    def _pool_meta(self, pool_addr: str) -> PoolMeta:
-        pool = self._pool_contract(pool_addr)
-
-        token0 = Web3.to_checksum_address(pool.functions.token0().call())
-        token1 = Web3.to_checksum_address(pool.functions.token1().call())
-
-        erc0 = self._erc20(token0)
-        erc1 = self._erc20(token1)
-
-        dec0 = int(erc0.functions.decimals().call())
-        dec1 = int(erc1.functions.decimals().call())
-
-        try:
-            sym0 = str(erc0.functions.symbol().call())
-        except Exception:
-            sym0 = "TOKEN0"
-        try:
-            sym1 = str(erc1.functions.symbol().call())
-        except Exception:
-            sym1 = "TOKEN1"
-
-        spacing = int(pool.functions.tickSpacing().call())
-        fee = int(pool.functions.fee().call())
-
-        return PoolMeta(
+        return _pool_contract_at(self.w3, pool_addr)
+
+    def _pool_meta(self, pool_addr: str, *, chain: str) -> PoolMeta:
+        pool_addr = Web3.to_checksum_address(pool_addr)
+
+        cache_key = f"{(chain or '').strip().lower()}:{pool_addr.lower()}"
+        hit = _POOL_META_CACHE.get(cache_key)
+        if hit and (time() - hit[0]) <= _POOL_META_TTL_SEC:
+            return hit[1]
+
+        # 1 round trip for the pool views, 1 for token decimals/symbol not cached yet
+        res_pool = batch_eth_call(self.w3, [
+            CallSpec(to=pool_addr, data=SEL_TOKEN0, out_types=["address"]),
+            CallSpec(to=pool_addr, data=SEL_TOKEN1, out_types=["address"]),
+            CallSpec(to=pool_addr, data=SEL_TICK_SPACING, out_types=["int24"]),
+            CallSpec(to=pool_addr, data=SEL_FEE, out_types=["uint24"]),
+        ])
+        if any(r is None for r in res_pool):
+            # surface the real RPC/ABI error
+            pool = self._pool_contract(pool_addr)
+            res_pool = [
+                pool.functions.token0().call(),
+                pool.functions.token1().call(),
+                pool.functions.tickSpacing().call(),
+                pool.functions.fee().call(),
+            ]
+
+        token0 = Web3.to_checksum_address(res_pool[0])
+        token1 = Web3.to_checksum_address(res_pool[1])
+        spacing = int(res_pool[2])
+        fee = int(res_pool[3])
+
+        tok_meta = {t: get_erc20_meta(chain, t) for t in (token0, token1)}
+        missing = [t for t, m in tok_meta.items() if m is None]
+        if missing:
+            res_tok = batch_eth_call(self.w3, [c for t in missing for c in erc20_meta_calls(t)])
+            for i, t in enumerate(missing):
+                tok_meta[t] = set_erc20_meta(chain, t, res_tok[2 * i:2 * i + 2])
+
+        # decimals feed raw amounts: no default, surface the real error
+        dec0 = tok_meta[token0][0] if tok_meta[token0] else read_erc20_decimals(self.w3, token0)
+        dec1 = tok_meta[token1][0] if tok_meta[token1] else read_erc20_decimals(self.w3, token1)
+        sym0 = (tok_meta[token0] and tok_meta[token0][1]) or "TOKEN0"
+        sym1 = (tok_meta[token1] and tok_meta[token1][1]) or "TOKEN1"
+
+        # values are already typed (checksummed addresses, ints): skip pydantic validation
+        meta = PoolMeta.model_construct(
             token0=token0,
             token1=token1,
             dec0=dec0,
@@ -154,18 +175,18 @@ class AutoRebalancePancakeUseCase:
             spacing=spacing,
             fee=fee,
         )
+        _POOL_META_CACHE[cache_key] = (time(), meta)
+        return meta
 
     def _resolve_range_ticks(
         self,
         *,
-        pool_addr: str,
+        meta: PoolMeta,
         new_lower: Optional[int],
         new_upper: Optional[int],
         lower_price: Optional[float],
         upper_price: Optional[float],
     ) -> Tuple[int, int, RangeDebug]:
-        meta = self._pool_meta(pool_addr)
-
         # ticks directly provided
         if new_lower is not None and new_upper is not None:
             lower_tick = int(new_lower)
@@ -195,17 +216,17 @@ class AutoRebalancePancakeUseCase:
             lower_tick -= step
             upper_tick += step
 
-        if int(lower_tick) >= int(upper_tick):
+        if lower_tick >= upper_tick:
             raise ValueError("Resolved ticks invalid (lower >= upper). Check provided prices.")
 
-        dbg = RangeDebug(
+        dbg = RangeDebug.model_construct(
             sym0=meta.sym0,
             sym1=meta.sym1,
             dec0=meta.dec0,
             dec1=meta.dec1,
             spacing=meta.spacing,
         )
-        return int(lower_tick), int(upper_tick), dbg
+        return lower_tick, upper_tick, dbg
 
     def auto_rebalance_pancake(
         self,
@@ -221,7 +242,7 @@ class AutoRebalancePancakeUseCase:
         swap_amount_in: float,
         swap_amount_out_min: float,
         sqrt_price_limit_x96: int = 0,
-        gas_strategy: str = "buffered",
+        gas_strategy: GasStrategy = GasStrategy.BUFFERED,
     ) -> dict:
         ent = self._get_vault_by_alias(alias)
 
@@ -237,7 +258,8 @@ class AutoRebalancePancakeUseCase:
         if not (isinstance(pool_addr, str) and pool_addr.startswith("0x") and len(pool_addr) == 42):
             raise ValueError("Pool address not found in registry config.pool (required for price->tick and fee inference)")
 
-        meta = self._pool_meta(pool_addr)
+        chain = (ent.chain or "").strip().lower()
+        meta = self._pool_meta(pool_addr, chain=chain)
         
         t0 = Web3.to_checksum_address(meta.token0)
         t1 = Web3.to_checksum_address(meta.token1)
@@ -251,35 +273,34 @@ class AutoRebalancePancakeUseCase:
         dec_out = meta.dec1 if tout == t1 else meta.dec0
 
         lower_tick, upper_tick, range_dbg = self._resolve_range_ticks(
-            pool_addr=pool_addr,
+            meta=meta,
             new_lower=lower_tick,
             new_upper=upper_tick,
             lower_price=lower_price,
             upper_price=upper_price,
         )
 
-        # infer fee from pool if missing
-        if fee is None:
-            fee = int(meta.fee)
+        # infer fee from pool if missing; caller-supplied values are coerced once here
+        fee = meta.fee if fee is None else int(fee)
+        sqrt_price_limit_x96 = int(sqrt_price_limit_x96 or 0)
 
-        if swap_amount_in > 0 and (fee is None or int(fee) <= 0):
+        if swap_amount_in > 0 and fee <= 0:
             raise ValueError("fee is required (or inferable) when swap_amount_in > 0")
 
         # converter HUMAN -> RAW
-        amount_in_raw = _human_to_raw(float(swap_amount_in or 0.0), int(dec_in))
-        amount_out_min_raw = _human_to_raw(float(swap_amount_out_min or 0.0), int(dec_out))
+        amount_in_raw = _human_to_raw(float(swap_amount_in or 0.0), dec_in)
+        amount_out_min_raw = _human_to_raw(float(swap_amount_out_min or 0.0), dec_out)
         
-        params = AutoRebalancePancakeParams(
-            **{
-                "newLower": int(lower_tick),
-                "newUpper": int(upper_tick),
-                "fee": int(fee),
-                "tokenIn": token_in,
-                "tokenOut": token_out,
-                "swapAmountIn": int(amount_in_raw),
-                "swapAmountOutMin": int(amount_out_min_raw),
-                "sqrtPriceLimitX96": int(sqrt_price_limit_x96 or 0),
-            }
+        # built from already-coerced ints/addresses: construct without re-validating
+        params = AutoRebalancePancakeParams.model_construct(
+            new_lower=lower_tick,
+            new_upper=upper_tick,
+            fee=fee,
+            token_in=token_in,
+            token_out=token_out,
+            swap_amount_in=amount_in_raw,
+            swap_amount_out_min=amount_out_min_raw,
+            sqrt_price_limit_x96=sqrt_price_limit_x96,
         )
 
         cv = ClientVaultAdapter(w3=self.w3, address=vault_addr)
@@ -288,12 +309,12 @@ class AutoRebalancePancakeUseCase:
         swap_resolved = {
                     "token_in": tin,
                     "token_out": tout,
-                    "dec_in": int(dec_in),
-                    "dec_out": int(dec_out),
+                    "dec_in": dec_in,
+                    "dec_out": dec_out,
                     "amount_in_human": float(swap_amount_in or 0.0),
                     "amount_out_min_human": float(swap_amount_out_min or 0.0),
-                    "amount_in_raw": int(amount_in_raw),
-                    "amount_out_min_raw": int(amount_out_min_raw),
+                    "amount_in_raw": amount_in_raw,
+                    "amount_out_min_raw": amount_out_min_raw,
                 }
         
         tx_any = self.txs.send(fn, wait=True, gas_strategy=gas_strategy)
@@ -304,8 +325,8 @@ class AutoRebalancePancakeUseCase:
                 "alias": ent.alias,
                 "vault_address": Web3.to_checksum_address(vault_addr),
                 "pool_address": Web3.to_checksum_address(pool_addr),
-                "range_used": RangeUsed(lower_tick=int(lower_tick), upper_tick=int(upper_tick)).model_dump(),
-                "fee_used": int(fee),
+                "range_used": RangeUsed.model_construct(lower_tick=lower_tick, upper_tick=upper_tick).model_dump(),
+                "fee_used": fee,
                 "range_debug": range_dbg.model_dump(),
                 "swap_resolved": swap_resolved
             }
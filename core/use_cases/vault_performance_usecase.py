@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal, getcontext
-from typing import Any, Dict, List, Optional, Tuple
+from time import time_ns
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 from web3 import Web3
 
@@ -14,6 +16,7 @@ from adapters.external.market_data.market_data_http_client import MarketDataHttp
 from adapters.external.signals.signals_http_client import SignalsHttpClient
 
 from config import get_settings
+from core.services.utils import raw_to_human
 from core.use_cases.vaults_client_vault_usecase import VaultClientVaultUseCase
 
 
@@ -30,7 +33,7 @@ STABLE_DECIMALS_BY_CHAIN: Dict[str, Dict[str, int]] = {
 
 
 def _now_ms() -> int:
-    return int(datetime.now(timezone.utc).timestamp() * 1000)
+    return time_ns() // 1_000_000
 
 
 def _ms_to_iso(ts_ms: int) -> str:
@@ -124,8 +127,7 @@ def _raw_to_human_float(amount_raw: Optional[str], decimals: Optional[int]) -> O
         d = int(decimals)
         if d < 0 or d > 255:
             return None
-        val = Decimal(raw_i) / (Decimal(10) ** Decimal(d))
-        return float(val)
+        return raw_to_human(raw_i, d)
     except Exception:
         return None
 
@@ -136,7 +138,7 @@ class VaultPerformanceUseCase:
     user_events_repo: VaultUserEventsRepositoryMongoDB
     signals_client: SignalsHttpClient
     market_data: MarketDataHttpClient
-    stable_tokens: List[str]
+    stable_tokens: FrozenSet[str]
 
     @classmethod
     def from_settings(cls) -> "VaultPerformanceUseCase":
@@ -146,21 +148,25 @@ class VaultPerformanceUseCase:
         signals_client = SignalsHttpClient.from_settings()
         market_data = MarketDataHttpClient.from_settings()
 
-        st = get_settings()
-        stable = [x.strip().lower() for x in (st.STABLE_TOKEN_ADDRESSES or []) if isinstance(x, str) and x.strip()]
 
         return cls(
             vault_repo=vault_repo,
             user_events_repo=user_events_repo,
             signals_client=signals_client,
             market_data=market_data,
-            stable_tokens=stable,
+            stable_tokens=get_settings().STABLE_TOKEN_SET,
         )
 
     def _is_stable_token(self, token_addr: Optional[str]) -> bool:
         if not token_addr:
             return False
-        return token_addr.strip().lower() in set(self.stable_tokens or [])
+        return token_addr.strip().lower() in self.stable_tokens
+
+    def _live_status(self, alias: str) -> Optional[Dict[str, Any]]:
+        try:
+            return VaultClientVaultUseCase.from_settings().get_status(alias_or_address=alias)
+        except Exception:
+            return None
 
     async def _get_decimals_and_price_usd(
         self,
@@ -262,27 +268,34 @@ class VaultPerformanceUseCase:
         dex = (v_doc.get("dex") or "").strip().lower()
         chain = (v_doc.get("chain") or "").strip().lower()
 
-        # --- 1) Episodes from api-signals
-        episodes_res = {}
-        episodes_items: List[Dict[str, Any]] = []
-        episodes_total: Optional[int] = None
-        if dex and alias:
-            episodes_res = await self.signals_client.list_episodes_by_vault(
+        # --- independent reads fan out together: episodes (HTTP), user cashflows (Mongo)
+        # and live status (RPC). Blocking calls run in worker threads so they overlap.
+        async def _episodes() -> Any:
+            if not (dex and alias):
+                return {}
+            return await self.signals_client.list_episodes_by_vault(
                 dex=dex,
                 alias=alias,
                 limit=int(episodes_limit),
                 offset=0,
                 access_token=access_token,
             )
-            episodes_items = list((episodes_res.get("data") or []) if isinstance(episodes_res, dict) else [])
-            episodes_total = episodes_res.get("total") if isinstance(episodes_res, dict) else None
+
+        episodes_res, user_items, st = await asyncio.gather(
+            _episodes(),
+            asyncio.to_thread(self.user_events_repo.list_by_vault, vault=vault_addr, limit=5000, offset=0),
+            asyncio.to_thread(self._live_status, alias),
+        )
+
+        # --- 1) Episodes from api-signals
+        episodes_items: List[Dict[str, Any]] = list((episodes_res.get("data") or []) if isinstance(episodes_res, dict) else [])
+        episodes_total: Optional[int] = episodes_res.get("total") if isinstance(episodes_res, dict) else None
 
         # --- 2) Vault events (gas) [kept as-is]
         gas_total_usd = 0
         gas_cnt = 0
 
-        # --- 3) User cashflows
-        user_items = self.user_events_repo.list_by_vault(vault=vault_addr, limit=5000, offset=0)
+        # --- 3) User cashflows (fetched above)
 
         cashflows: List[Dict[str, Any]] = []
         cashflows_signed: List[Tuple[int, float]] = []
@@ -465,15 +478,6 @@ class VaultPerformanceUseCase:
             "source": "unknown",
         }
 
-        st = None
-        try:
-            status_uc = VaultClientVaultUseCase.from_settings()
-            if hasattr(status_uc, "get_status"):
-                got = status_uc.get_status(alias)
-                st = (await got) if hasattr(got, "__await__") else got
-        except Exception:
-            st = None
-
         if isinstance(st, dict):
             holdings = st.get("holdings") or {}
             totals = holdings.get("totals") or {}
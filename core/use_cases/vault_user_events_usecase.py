@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from decimal import Decimal, getcontext
 from typing import Any, Dict, List, Optional, Set, Tuple
@@ -237,7 +238,7 @@ class VaultUserEventsUseCase:
 
         st = get_settings()
         market_data = MarketDataHttpClient.from_settings()
-        stable_tokens = set([x.strip().lower() for x in (st.STABLE_TOKEN_ADDRESSES or []) if x])
+        stable_tokens = set(st.STABLE_TOKEN_SET)
 
         return cls(
             vault_repo=vault_repo,
@@ -349,6 +350,7 @@ class VaultUserEventsUseCase:
 
         # If decimals missing but we have raw, try to get decimals from pricing (as you requested)
         dec_i: Optional[int] = int(decimals) if decimals is not None else None
+        pricing: Optional[Dict[str, Any]] = None
         if dec_i is None and amount_raw:
             pricing = await self._try_get_pricing_details(chain=(chain or "").strip().lower(), token_address=token_c)
             meta = _extract_token_meta_from_pricing(pricing, token_address=token_c)
@@ -362,7 +364,12 @@ class VaultUserEventsUseCase:
             if inferred_h is not None:
                 human_s = inferred_h
 
-        token_price_usd = await self._try_get_price_usd(chain=(chain or "").strip().lower(), token_address=token_c)
+        if pricing is not None and not self._is_stable(token_c):
+            # same market-data endpoint already answered above: reuse its price
+            px = pricing.get("price_usd")
+            token_price_usd = str(px) if px is not None else None
+        else:
+            token_price_usd = await self._try_get_price_usd(chain=(chain or "").strip().lower(), token_address=token_c)
 
         ent = VaultUserEventEntity(
             vault=vault,
@@ -427,10 +434,11 @@ class VaultUserEventsUseCase:
         chain_n = (chain or "").strip().lower()
         if payout_transfers:
             unique_tokens = sorted({(tr.token or "").strip() for tr in payout_transfers if tr.token})
-            pricing_by_token: Dict[str, Dict[str, Any]] = {}
-
-            for tk in unique_tokens:
-                pricing_by_token[tk] = await self._try_get_pricing_details(chain=chain_n, token_address=tk)
+            # one market-data call per token, issued concurrently (each call is best-effort)
+            pricing_list = await asyncio.gather(
+                *(self._try_get_pricing_details(chain=chain_n, token_address=tk) for tk in unique_tokens)
+            )
+            pricing_by_token: Dict[str, Dict[str, Any]] = dict(zip(unique_tokens, pricing_list))
 
             for tr in payout_transfers:
                 pr = pricing_by_token.get(tr.token) or {}
@@ -3,7 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import UTC, datetime
 import json
-from typing import Any, Dict, Optional
+from time import time
+from typing import Any, Dict, Optional, Tuple
 
 from web3 import Web3
 from web3.contract.contract import Contract
@@ -27,6 +28,18 @@ from core.domain.schemas.vault_inputs import VaultCreateConfigIn
 from core.services.vault_status_service import ZERO_ADDR, VaultStatusService
 from core.services.web3_cache import get_web3
 
+# ---- vault_registry lookup cache (status reads) ----
+# Misses are kept longer than hits so a bad alias can't hammer Mongo; any registry write clears it.
+_VAULT_LOOKUP_CACHE: Dict[str, Tuple[float, Optional[VaultRegistryEntity]]] = {}
+_VAULT_LOOKUP_HIT_TTL_SEC = 30
+_VAULT_LOOKUP_MISS_TTL_SEC = 60
+_VAULT_LOOKUP_MAX_ENTRIES = 1024
+
+
+def _invalidate_vault_lookup_cache() -> None:
+    _VAULT_LOOKUP_CACHE.clear()
+
+
 def _is_address_like(s: str) -> bool:
     return isinstance(s, str) and s.startswith("0x") and len(s) == 42
 
@@ -95,6 +108,29 @@ class VaultClientVaultUseCase:
                 alias_or_address = vault.config.address
                 return Web3.to_checksum_address(alias_or_address)
         raise ValueError("Unknown vault alias/address (send the vault address in the path)")
+
+    def _find_vault_cached(self, key: str) -> Optional[VaultRegistryEntity]:
+        hit = _VAULT_LOOKUP_CACHE.get(key)
+        if hit:
+            ts, v = hit
+            ttl = _VAULT_LOOKUP_HIT_TTL_SEC if v is not None else _VAULT_LOOKUP_MISS_TTL_SEC
+            if (time() - ts) <= ttl:
+                return v
+
+        if _is_address_like(key):
+            try:
+                addr = Web3.to_checksum_address(key)
+            except Exception:
+                raise ValueError("Invalid vault address")
+            v = self.vault_registry_repo.find_by_address(addr)
+        else:
+            v = self.vault_registry_repo.find_by_alias(key)
+
+        if len(_VAULT_LOOKUP_CACHE) >= _VAULT_LOOKUP_MAX_ENTRIES:
+            # dicts keep insertion order: drop the oldest entry
+            _VAULT_LOOKUP_CACHE.pop(next(iter(_VAULT_LOOKUP_CACHE)), None)
+        _VAULT_LOOKUP_CACHE[key] = (time(), v)
+        return v
     
     # -------- reads --------
 
@@ -110,14 +146,7 @@ class VaultClientVaultUseCase:
             raise ValueError("alias_or_address is required")
 
         # ---- vault_registry ----
-        if _is_address_like(key):
-            try:
-                addr = Web3.to_checksum_address(key)
-            except Exception:
-                raise ValueError("Invalid vault address")
-            v = self.vault_registry_repo.find_by_address(addr)
-        else:
-            v = self.vault_registry_repo.find_by_alias(key)
+        v = self._find_vault_cached(key)
 
         if not v:
             raise ValueError("Vault not found in vault_registry")
@@ -314,6 +343,7 @@ class VaultClientVaultUseCase:
         )
 
         saved = self.vault_registry_repo.insert(entity)
+        _invalidate_vault_lookup_cache()
 
         await self.signals_http_client.link_vault_to_strategy(
             chain=chain,
@@ -374,7 +404,9 @@ class VaultClientVaultUseCase:
             "config.daily_harvest": {"enabled": bool(enabled), "cooldown_sec": int(cooldown_sec)},
             "config.jobs.harvest_job.enabled": bool(enabled),
         }
-        return self.vault_registry_repo.update_fields(address=vault_addr, set_fields=set_fields)
+        updated = self.vault_registry_repo.update_fields(address=vault_addr, set_fields=set_fields)
+        _invalidate_vault_lookup_cache()
+        return updated
 
     def update_compound_config_in_registry(
         self,
@@ -389,7 +421,9 @@ class VaultClientVaultUseCase:
             "config.compound": {"enabled": bool(enabled), "cooldown_sec": int(cooldown_sec)},
             "config.jobs.compound_job.enabled": bool(enabled),
         }
-        return self.vault_registry_repo.update_fields(address=vault_addr, set_fields=set_fields)
+        updated = self.vault_registry_repo.update_fields(address=vault_addr, set_fields=set_fields)
+        _invalidate_vault_lookup_cache()
+        return updated
 
     def update_reward_swap_config_in_registry(
         self,
@@ -415,4 +449,6 @@ class VaultClientVaultUseCase:
             "config.reward_swap": rs,
             "config.jobs.harvest_job.swap_rewards": bool(enabled),
         }
-        return self.vault_registry_repo.update_fields(address=vault_addr, set_fields=set_fields)
\ No newline at end of file
+        updated = self.vault_registry_repo.update_fields(address=vault_addr, set_fields=set_fields)
+        _invalidate_vault_lookup_cache()
+        return updated
\ No newline at end of file
@@ -1,13 +1,21 @@
 # main.py
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import signal
+import time
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
-from adapters.external.database.vault_events_repository_mongodb import VaultEventsRepository
-from adapters.external.database.vault_state_repository import VaultStateRepository
+from adapters.entry.http.responses import FastJSONResponse
 from adapters.entry.http.views.client_vault_view import router as vaults_client_vault_router
 from adapters.entry.http.views.admin.admin_view import router as admin_router
 from adapters.entry.http.views.contracts_address_view import router as contracts_router
@@ -19,6 +27,22 @@ from adapters.entry.http.views.admin.admin_vault_fee_buffer_view import router a
 from adapters.entry.http.views.vault_user_events_view import router as vaults_user_events_router
 from adapters.entry.http.views.vault_performance_view import router as vault_performance_router
 
+logger = logging.getLogger(__name__)
+
+# pause between repositories' ensure_indexes calls during background startup
+_INDEX_INIT_SPACING_S = 0.1
+
+
+def _index_marker_id(repo_classes: tuple) -> str:
+    """
+    Marker id derived from the index specs the repositories declare (INDEXES),
+    so adding or changing an index changes the marker and the next start rebuilds.
+    """
+    specs = [(cls.COLLECTION_NAME, cls.INDEXES) for cls in repo_classes]
+    digest = hashlib.sha256(json.dumps(specs, sort_keys=True).encode()).hexdigest()[:16]
+    return f"mongo_indexes_{digest}"
+
+
 def init_mongo_indexes() -> None:
     """
     Initialize MongoDB indexes for all vault-related collections.
@@ -26,14 +50,48 @@ def init_mongo_indexes() -> None:
     This makes sure the application has the expected indexes for efficient
     queries and unique constraints before serving any request.
     """
+    # imported here: only needed by this startup task, not by module import
+    from adapters.external.database.mongo_client import get_mongo_db
+    from adapters.external.database.vault_events_repository_mongodb import VaultEventsRepository
+    from adapters.external.database.vault_state_repository import VaultStateRepository
+
+    repo_classes = (VaultStateRepository, VaultEventsRepository)
+    marker_id = _index_marker_id(repo_classes)
+
+    # once per index set: every worker/replica after the first successful build skips it
+    meta = get_mongo_db()["system_meta"]
+    if meta.find_one({"_id": marker_id}, {"_id": 1}) is not None:
+        return
+
+    # each repository ensures its own indexes on construction; building them one
+    # at a time with a short gap keeps startup from bursting the connection pool
+    for i, repo_cls in enumerate(repo_classes):
+        if i:
+            time.sleep(_INDEX_INIT_SPACING_S)
+        repo_cls()
+
+    # marked only after success, so a failed build is retried by the next start
+    meta.update_one(
+        {"_id": marker_id},
+        {"$setOnInsert": {"at": int(time.time())}},
+        upsert=True,
+    )
+
 
-    # Vault state indexes
-    state_repo = VaultStateRepository()
-    state_repo.ensure_indexes()
+async def _init_mongo_indexes_background(ready: asyncio.Event) -> None:
+    """
+    Build indexes in a worker thread and flag readiness when done.
 
-    # Vault events indexes
-    events_repo = VaultEventsRepository()
-    events_repo.ensure_indexes()
+    On failure the process shuts itself down (SIGTERM, handled by uvicorn) instead
+    of serving without its unique indexes, like the old blocking startup did.
+    """
+    try:
+        await asyncio.to_thread(init_mongo_indexes)
+    except Exception:
+        logger.exception("init_mongo_indexes failed; shutting down")
+        os.kill(os.getpid(), signal.SIGTERM)
+        return
+    ready.set()
 
 
 @asynccontextmanager
@@ -42,24 +100,30 @@ async def lifespan(app: FastAPI):
     FastAPI lifespan context.
 
     Runs once on startup (before the first request) and once on shutdown.
-    Here we make sure MongoDB indexes exist before handling traffic.
+    MongoDB indexes are created in the background so startup does not wait on
+    the cluster; /healthz reports 503 until they exist.
     """
-    init_mongo_indexes()
+    app.state.indexes_ready = asyncio.Event()
+    app.state.indexes_task = asyncio.create_task(_init_mongo_indexes_background(app.state.indexes_ready))
     yield
-    # No special shutdown logic needed for now.
+    if not app.state.indexes_task.done():
+        app.state.indexes_task.cancel()
 
 
+@lru_cache(maxsize=1)
 def create_app() -> FastAPI:
     """
     Application factory for the DEX Vault API.
 
-    Wires routes and configures the application lifespan so that infrastructure
-    (MongoDB indexes) is ready before processing requests.
+    Wires routes and configures the application lifespan, which prepares
+    infrastructure (MongoDB indexes) in the background behind /healthz.
+    Cached, so repeated imports/factory calls in one process share one app.
     """
     app = FastAPI(
         title="DEX Vault API",
         version="0.1.0",
         lifespan=lifespan,
+        default_response_class=FastJSONResponse,
     )
 
     app.add_middleware(
@@ -80,7 +144,15 @@ def create_app() -> FastAPI:
     app.include_router(protocol_fee_collector_router, prefix="/api")
     app.include_router(admin_vault_fee_buffer_router, prefix="/api")
     app.include_router(vault_performance_router, prefix="/api")
-    
+
+    @app.get("/healthz", include_in_schema=False)
+    async def healthz(request: Request) -> JSONResponse:
+        """Readiness probe: 503 until startup MongoDB indexes are in place."""
+        ready = getattr(request.app.state, "indexes_ready", None)
+        if ready is None or not ready.is_set():
+            return JSONResponse(status_code=503, content={"status": "starting"})
+        return JSONResponse(status_code=200, content={"status": "ok"})
+
     return app
 
 
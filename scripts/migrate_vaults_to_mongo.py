@@ -6,7 +6,7 @@ to MongoDB collections.
 
 Usage (from project root):
 
-    python -m scripts.migrate_vaults_to_mongo
+    python -m scripts.migrate_vaults_to_mongo --data-root /path/to/data
 
 Assumptions:
 
@@ -26,11 +26,15 @@ Collections created/used:
 
 - `vault_registry`
     One document per (dex, alias) with fields:
-      - dex, alias, config, is_active, created_at, updated_at
+      - dex, alias, address (from config.address), config, is_active,
+        created_at, updated_at (+ *_iso)
 
 - `vault_state`
     One document per (dex, alias) with fields:
-      - dex, alias, state, created_at, updated_at
+      - dex, alias, state, created_at, updated_at (+ *_iso)
+
+    created_at/updated_at are epoch milliseconds (BSON int64) with the ISO
+    string alongside in created_at_iso/updated_at_iso, as written by the API.
 
 - `vault_events`
     One document per historical event, extracted from the legacy state JSON:
@@ -38,6 +42,8 @@ Collections created/used:
 
 This script is idempotent in the following sense:
 
+- Registry and state documents are written with `$setOnInsert` upserts keyed
+  on (dex, alias), so existing documents are never overwritten.
 - If a document for (dex, alias) already exists in MongoDB in `vault_state`,
   that alias is skipped entirely (state and events), assuming it was already
   migrated successfully.
@@ -50,17 +56,30 @@ again.
 from __future__ import annotations
 
 import argparse
+import itertools
 import json
 import logging
+import os
+import queue
+import threading
 import time
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from pymongo import UpdateOne
+from pymongo.collection import Collection
+from bson.errors import InvalidDocument
+from pymongo.errors import BulkWriteError
+from pymongo.write_concern import WriteConcern
 
 from config import get_settings
-from adapters.external.database.mongo_client import get_mongo_db
-from adapters.external.database.vault_registry_repository import VaultRegistryRepository
+from adapters.external.database.mongo_client import get_mongo_db, get_mongo_db_for_migration
+from adapters.external.database.vault_client_registry_repository_mongodb import VaultRegistryRepositoryMongoDB
 from adapters.external.database.vault_state_repository import VaultStateRepository
+from core.domain.entities.base_entity import MongoEntity
+from core.services.normalize import _norm_lower
 
 logger = logging.getLogger("migrate_vaults_to_mongo")
 
@@ -68,37 +87,330 @@ logger = logging.getLogger("migrate_vaults_to_mongo")
 INT64_MIN = -(2**63)
 INT64_MAX = 2**63 - 1
 
+# documents per insert_many call
+INSERT_BATCH_SIZE = 1000
+
+# upper bound on history events held in memory before they are written out
+EVENTS_BATCH_SIZE = 5000
+
+# background threads reading/parsing state files per DEX, and how many parsed
+# files may wait for the Mongo writer at once
+STATE_READ_WORKERS = 4
+STATE_READ_QUEUE_SIZE = 2 * STATE_READ_WORKERS
+# parsed-but-not-yet-consumed files across *all* DEXes running in parallel
+STATE_READ_BUDGET = 16
+
+# DEXes migrated concurrently; well under MongoClient's default maxPoolSize (100)
+MAX_DEX_WORKERS = 8
+
+
+def _norm_int(obj: int) -> Any:
+    if obj < INT64_MIN or obj > INT64_MAX:
+        return str(obj)
+    return obj
+
+
+def _norm_dict(obj: Dict[Any, Any]) -> Dict[Any, Any]:
+    # copy-on-write: BSON-safe subtrees are returned as the same object
+    out: Optional[Dict[Any, Any]] = None
+    get = _DISPATCH.get
+    for k, v in obj.items():
+        t = type(v)
+        # ints are the common leaf: range-check inline instead of dispatching
+        if t is int:
+            if INT64_MIN <= v <= INT64_MAX:
+                continue
+            nv: Any = str(v)
+        else:
+            fn = get(t)
+            if fn is None:
+                continue
+            nv = fn(v)
+            if nv is v:
+                continue
+        if out is None:
+            out = dict(obj)
+        out[k] = nv
+    return obj if out is None else out
+
+
+def _norm_list(obj: List[Any]) -> List[Any]:
+    out: Optional[List[Any]] = None
+    get = _DISPATCH.get
+    for i, v in enumerate(obj):
+        t = type(v)
+        if t is int:
+            if INT64_MIN <= v <= INT64_MAX:
+                continue
+            nv: Any = str(v)
+        else:
+            fn = get(t)
+            if fn is None:
+                continue
+            nv = fn(v)
+            if nv is v:
+                continue
+        if out is None:
+            out = list(obj)
+        out[i] = nv
+    return obj if out is None else out
+
+
+def _norm_seq(obj: Any) -> List[Any]:
+    # tuples/sets always become lists
+    return _norm_list(list(obj))
+
+
+# exact-type dispatch; bool is its own type so it falls through untouched
+_DISPATCH: Dict[type, Callable[[Any], Any]] = {
+    int: _norm_int,
+    dict: _norm_dict,
+    list: _norm_list,
+    tuple: _norm_seq,
+    set: _norm_seq,
+}
+
 
 def normalize_for_bson(obj: Any) -> Any:
     """
-    Recursively walk a JSON-like structure and ensure it is BSON-safe.
+    Walk a JSON-like structure and ensure it is BSON-safe.
 
     - All ints that do not fit into 64 bits are converted to strings.
     - dicts, lists and tuples are traversed recursively.
     - Other scalar types are returned as-is.
 
+    Containers that are already BSON-safe are returned unchanged (same object),
+    so only the path down to an oversized int is copied.
+
     This avoids OverflowError: MongoDB can only handle up to 8-byte ints.
     """
-    # bool is subclass of int, so check it first
-    if isinstance(obj, bool):
+    fn = _DISPATCH.get(type(obj))
+    if fn is None:
         return obj
+    return fn(obj)
 
-    # large ints -> string
-    if isinstance(obj, int):
-        if obj < INT64_MIN or obj > INT64_MAX:
-            return str(obj)
-        return obj
 
-    # dict
-    if isinstance(obj, dict):
-        return {k: normalize_for_bson(v) for k, v in obj.items()}
+def _is_id_duplicate(err: Dict[str, Any]) -> bool:
+    if err.get("code") != 11000:
+        return False
+    key_pattern = err.get("keyPattern")
+    if key_pattern is not None:
+        return set(key_pattern) == {"_id"}
+    # servers that omit keyPattern still name the index in the message
+    return " index: _id_ " in str(err.get("errmsg") or "")
 
-    # list / tuple / set
-    if isinstance(obj, (list, tuple, set)):
-        return [normalize_for_bson(v) for v in obj]
 
-    # leave everything else (str, float, None, etc.) as-is
-    return obj
+def _flush_inserts(coll: Collection, docs: List[Dict[str, Any]], label: str) -> int:
+    """
+    Insert the pending documents in one unordered `insert_many` and clear the list.
+
+    Unordered so a single bad (or duplicate) document does not abort the rest
+    of the batch. Partial failures are logged.
+
+    Documents are sent as-is first; only when the BSON encoder rejects the batch
+    (an int wider than 64 bits) is it re-sent through `normalize_for_bson`.
+    insert_many has already assigned `_id`s by then, so anything that made it to
+    the server before the error is rejected as a duplicate instead of written twice.
+    Those `_id` duplicates are counted as inserted (by the first pass), not logged.
+
+    Returns:
+        The number of documents actually inserted.
+    """
+    if not docs:
+        return 0
+
+    fell_back = False
+    try:
+        try:
+            res = coll.insert_many(docs, ordered=False)
+        except (OverflowError, InvalidDocument):
+            fell_back = True
+            res = coll.insert_many([normalize_for_bson(d) for d in docs], ordered=False)
+        inserted = len(res.inserted_ids)
+    except BulkWriteError as exc:
+        details = exc.details or {}
+        inserted = int(details.get("nInserted", 0))
+        errors = details.get("writeErrors") or []
+        if fell_back:
+            committed_first = [e for e in errors if _is_id_duplicate(e)]
+            inserted += len(committed_first)
+            errors = [e for e in errors if not _is_id_duplicate(e)]
+        if errors:
+            logger.error(
+                "[%s] insert_many partially failed: inserted=%d failed=%d first_error=%s",
+                label,
+                inserted,
+                len(errors),
+                errors[0].get("errmsg"),
+            )
+    finally:
+        docs.clear()
+
+    return inserted
+
+
+def _upsert_ops(docs: List[Dict[str, Any]]) -> List[UpdateOne]:
+    return [
+        UpdateOne({"dex": d["dex"], "alias": d["alias"]}, {"$setOnInsert": d}, upsert=True)
+        for d in docs
+    ]
+
+
+def _inserted_this_run(coll: Collection, docs: List[Dict[str, Any]]) -> Set[int]:
+    """
+    Positions of `docs` whose (dex, alias) document was created by this run.
+
+    All documents of one batch share the run's `created_at` stamp, so a stored
+    document carrying that stamp was inserted by us, whichever attempt sent it.
+    """
+    keys = {(d["dex"], d["alias"]) for d in docs}
+    cursor = coll.find(
+        {
+            "alias": {"$in": sorted({alias for _, alias in keys})},
+            "created_at": docs[0]["created_at"],
+        },
+        {"dex": 1, "alias": 1, "_id": 0},
+    )
+    found = {(r.get("dex"), r.get("alias")) for r in cursor}
+    return {i for i, d in enumerate(docs) if (d["dex"], d["alias"]) in found}
+
+
+def _flush_upserts(coll: Collection, docs: List[Dict[str, Any]], label: str) -> Set[int]:
+    """
+    Upsert the pending documents with `$setOnInsert` in one unordered `bulk_write`
+    and clear the list.
+
+    The server does the existence check against the unique (dex, alias) index,
+    so documents that already exist are left untouched and re-runs are idempotent.
+
+    When the BSON encoder rejects an oversized int the batch is re-sent through
+    `normalize_for_bson`. pymongo may already have sent earlier sub-batches by
+    then, and the re-send reports those as existing, so in that case the
+    inserted set is read back from the server instead of the write result.
+
+    Returns:
+        The positions (within `docs`) of the documents that were inserted.
+    """
+    if not docs:
+        return set()
+
+    fell_back = False
+    try:
+        try:
+            res = coll.bulk_write(_upsert_ops(docs), ordered=False)
+        except (OverflowError, InvalidDocument):
+            fell_back = True
+            res = coll.bulk_write(
+                _upsert_ops([normalize_for_bson(d) for d in docs]), ordered=False
+            )
+        upserted = set(res.upserted_ids or {})
+    except BulkWriteError as exc:
+        details = exc.details or {}
+        upserted = {int(u["index"]) for u in details.get("upserted") or []}
+        errors = details.get("writeErrors") or []
+        logger.error(
+            "[%s] bulk_write partially failed: upserted=%d failed=%d first_error=%s",
+            label,
+            len(upserted),
+            len(errors),
+            errors[0].get("errmsg") if errors else None,
+        )
+
+    try:
+        if fell_back:
+            upserted = _inserted_this_run(coll, docs)
+    finally:
+        docs.clear()
+
+    return upserted
+
+
+def _read_json(path: Path) -> Any:
+    """
+    Parse a JSON file from its raw bytes.
+
+    `json.loads` accepts UTF-8 bytes directly, which skips the text-mode
+    decoding layer of `json.load(fh)`.
+    """
+    return json.loads(path.read_bytes())
+
+
+@lru_cache(maxsize=65536)
+def _ts_iso(ts: int) -> str:
+    """UTC ISO-8601 string with a Z suffix for epoch seconds (e.g. 2024-01-31T12:00:00Z)."""
+    tm = time.gmtime(ts)
+    return "%04d-%02d-%02dT%02d:%02d:%02dZ" % (
+        tm.tm_year,
+        tm.tm_mon,
+        tm.tm_mday,
+        tm.tm_hour,
+        tm.tm_min,
+        tm.tm_sec,
+    )
+
+
+_READ_DONE = object()
+_read_budget = threading.BoundedSemaphore(STATE_READ_BUDGET)
+
+
+def _read_state_files(paths: List[Tuple[str, Path]]) -> Iterator[Tuple[str, Path, Any]]:
+    """
+    Read and parse state files on background threads, yielding `(alias, path, data)`
+    in completion order while the caller writes to Mongo.
+
+    `data` is the exception instance when the file could not be read or parsed.
+    A reader takes a slot of the process-wide read budget before parsing a file and
+    the slot is given back once the caller has taken the result, so parallel DEXes
+    share one cap on parsed files waiting in memory. Only the caller touches pymongo.
+    """
+    if not paths:
+        return
+
+    todo: "queue.Queue[Tuple[str, Path]]" = queue.Queue()
+    for item in paths:
+        todo.put(item)
+    out: "queue.Queue[Any]" = queue.Queue(maxsize=STATE_READ_QUEUE_SIZE)
+    stop = threading.Event()
+    workers = min(STATE_READ_WORKERS, len(paths))
+
+    def _reader() -> None:
+        while not stop.is_set():
+            # timeout so an early stop is noticed while waiting for budget
+            if not _read_budget.acquire(timeout=0.2):
+                continue
+            try:
+                alias, path = todo.get_nowait()
+            except queue.Empty:
+                _read_budget.release()
+                break
+            try:
+                data = _read_json(path)
+            except Exception as exc:
+                data = exc
+            out.put((alias, path, data))
+        out.put(_READ_DONE)
+
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        for _ in range(workers):
+            ex.submit(_reader)
+
+        done = 0
+        try:
+            while done < workers:
+                item = out.get()
+                if item is _READ_DONE:
+                    done += 1
+                    continue
+                _read_budget.release()
+                yield item
+        finally:
+            # caller stopped early (or failed): unblock readers so the pool can shut down
+            stop.set()
+            while done < workers:
+                if out.get() is _READ_DONE:
+                    done += 1
+                else:
+                    _read_budget.release()
 
 
 def _discover_dexes(data_root: Path) -> List[str]:
@@ -145,8 +457,7 @@ def _load_vaults_json(vaults_path: Path) -> Dict:
         return {"active": None, "vaults": {}}
 
     try:
-        with vaults_path.open("r", encoding="utf-8") as fh:
-            data = json.load(fh)
+        data = _read_json(vaults_path)
         if not isinstance(data, dict):
             raise ValueError("vaults.json is not a JSON object")
         active = data.get("active")
@@ -159,10 +470,27 @@ def _load_vaults_json(vaults_path: Path) -> Dict:
         return {"active": None, "vaults": {}}
 
 
+def _unacknowledged(coll: Collection) -> Collection:
+    return coll.with_options(write_concern=WriteConcern(w=0))
+
+
+def _flush_registry(
+    coll: Collection,
+    fast_coll: Optional[Collection],
+    docs: List[Dict[str, Any]],
+) -> Tuple[int, int]:
+    n = len(docs)
+    if fast_coll is not None:
+        return _flush_inserts(fast_coll, docs, "registry"), 0
+    ins = len(_flush_upserts(coll, docs, "registry"))
+    return ins, n - ins
+
+
 def migrate_vault_registry_for_dex(
     dex: str,
     data_root: Path,
-    registry_repo: VaultRegistryRepository,
+    registry_repo: VaultRegistryRepositoryMongoDB,
+    unacknowledged: bool = False,
 ) -> Tuple[int, int]:
     """
     Migrate vault registry information for a single DEX from `vaults.json`
@@ -172,6 +500,8 @@ def migrate_vault_registry_for_dex(
         dex: DEX identifier (directory name under DATA_ROOT).
         data_root: Root data directory.
         registry_repo: Repository used to interact with MongoDB.
+        unacknowledged: Send plain w=0 inserts and let the repository's unique
+            alias index drop duplicates; counts are then "sent", not confirmed.
 
     Returns:
         A tuple `(inserted_count, skipped_count)` with the number of vault
@@ -187,51 +517,84 @@ def migrate_vault_registry_for_dex(
 
     inserted = 0
     skipped = 0
+    pending: List[Dict[str, Any]] = []
 
     coll = registry_repo.collection
-    now = datetime.utcnow().isoformat()
+    fast_coll = _unacknowledged(coll) if unacknowledged else None
+    now_ms, now_iso = MongoEntity.now_stamp()
 
     for alias, config in vaults_dict.items():
-        existing = coll.find_one({"dex": dex, "alias": alias})
-        if existing:
-            logger.info(
-                "[registry] DEX=%s alias=%s already exists in Mongo, skipping.",
-                dex,
-                alias,
-            )
-            skipped += 1
-            continue
-
         is_active = bool(active_alias and alias == active_alias)
+        config = config or {}
         doc = {
             "dex": dex,
             "alias": alias,
-            "config": config or {},
+            "config": config,
             "is_active": is_active,
-            "created_at": now,
-            "updated_at": now,
+            "created_at": now_ms,
+            "created_at_iso": now_iso,
+            "updated_at": now_ms,
+            "updated_at_iso": now_iso,
         }
-        safe_doc = normalize_for_bson(doc)
-        coll.insert_one(safe_doc)
-        logger.info(
-            "[registry] Inserted DEX=%s alias=%s is_active=%s",
-            dex,
-            alias,
-            is_active,
-        )
-        inserted += 1
+        # vault_registry is unique on address too; without it every legacy doc would
+        # index as address=null and collide after the first one
+        address = config.get("address") if isinstance(config, dict) else None
+        if isinstance(address, str) and address:
+            doc["address"] = _norm_lower(address)
+        pending.append(doc)
+        if len(pending) >= INSERT_BATCH_SIZE:
+            ins, skip = _flush_registry(coll, fast_coll, pending)
+            inserted += ins
+            skipped += skip
+
+    ins, skip = _flush_registry(coll, fast_coll, pending)
+    inserted += ins
+    skipped += skip
+
+    logger.info("[registry] DEX=%s inserted=%d already_present=%d", dex, inserted, skipped)
 
     return inserted, skipped
 
 
+# legacy state history arrays -> vault_events kind
+_HISTORY_KIND_BY_KEY: Dict[str, str] = {
+    "exec_history": "exec",
+    "collect_history": "collect",
+    "deposit_history": "deposit",
+    "error_history": "error",
+    "rewards_collect_history": "rewards_collect",
+}
+_HISTORY_KEYS = frozenset(_HISTORY_KIND_BY_KEY)
+
+
+def _chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield successive lists of at most `size` items."""
+    it = iter(items)
+    while True:
+        chunk = list(itertools.islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _history_len(state_data: Dict[str, Any]) -> int:
+    """Number of history entries (future events) in a legacy state dict."""
+    total = 0
+    for key in _HISTORY_KEYS:
+        raw = state_data.get(key)
+        if isinstance(raw, list):
+            total += len(raw)
+    return total
+
+
 def _split_state_and_events(
     dex: str,
     alias: str,
     state_data: Dict[str, Any],
-) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+) -> Tuple[Dict[str, Any], Iterator[Dict[str, Any]]]:
     """
-    Split the legacy state JSON into a short state payload and a list of event
-    documents suitable for insertion into the `vault_events` collection.
+    Split the legacy state JSON into a short state payload and a lazy stream of
+    event documents suitable for insertion into the `vault_events` collection.
 
     The following keys are interpreted as historical arrays and converted into
     events:
@@ -250,24 +613,25 @@ def _split_state_and_events(
     Returns:
         A tuple `(short_state, events)` where:
           - short_state: state_data without the history arrays.
-          - events: list of event documents with fields
-                    {dex, alias, kind, ts, ts_iso, payload}.
+          - events: iterator of event documents with fields
+                    {dex, alias, kind, ts, ts_iso, payload}, built as consumed.
     """
-    # Shallow copy so we can pop history keys without mutating the original
-    short_state: Dict[str, Any] = dict(state_data)
-
-    mapping = {
-        "exec_history": "exec",
-        "collect_history": "collect",
-        "deposit_history": "deposit",
-        "error_history": "error",
-        "rewards_collect_history": "rewards_collect",
+    # One pass; the input dict is left untouched
+    short_state: Dict[str, Any] = {
+        k: v for k, v in state_data.items() if k not in _HISTORY_KEYS
     }
+    return short_state, _iter_events(dex, alias, state_data)
+
 
-    events: List[Dict[str, Any]] = []
+def _iter_events(dex: str, alias: str, state_data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    # Plain dicts on purpose: pymongo's C encoder handles them in one pass, while
+    # splicing a pre-encoded (dex, alias, kind) prefix into RawBSONDocuments needs a
+    # Python-side bson.encode + concat per event and measured ~1.6x slower.
+    # entries without a usable ts share one fallback timestamp
+    now_s = int(time.time())
 
-    for key, kind in mapping.items():
-        raw = short_state.pop(key, None)
+    for key, kind in _HISTORY_KIND_BY_KEY.items():
+        raw = state_data.get(key)
         if not isinstance(raw, list):
             continue
 
@@ -280,27 +644,17 @@ def _split_state_and_events(
             ts_val = payload.get("ts")
             if isinstance(ts_val, (int, float)):
                 ts_s = int(ts_val)
-                ts_iso = datetime.fromtimestamp(ts_s, tz=timezone.utc).isoformat().replace(
-                    "+00:00", "Z"
-                )
             else:
-                now_s = int(time.time())
                 ts_s = now_s
-                ts_iso = datetime.fromtimestamp(ts_s, tz=timezone.utc).isoformat().replace(
-                    "+00:00", "Z"
-                )
 
-            event_doc: Dict[str, Any] = {
+            yield {
                 "dex": dex,
                 "alias": alias,
                 "kind": kind,
                 "ts": ts_s,
-                "ts_iso": ts_iso,
+                "ts_iso": _ts_iso(ts_s),
                 "payload": payload,
             }
-            events.append(event_doc)
-
-    return short_state, events
 
 
 def migrate_state_for_dex(
@@ -308,6 +662,7 @@ def migrate_state_for_dex(
     data_root: Path,
     state_repo: VaultStateRepository,
     events_collection_name: str = "vault_events",
+    unacknowledged: bool = False,
 ) -> Tuple[int, int]:
     """
     Migrate per-alias state JSON files for a single DEX into the
@@ -328,6 +683,8 @@ def migrate_state_for_dex(
         data_root: Root data directory.
         state_repo: Repository used to interact with MongoDB for state.
         events_collection_name: Name of the collection used for events.
+        unacknowledged: Insert state docs and events with w=0 and rely on the
+            unique (dex, alias) index instead of acknowledged upserts.
 
     Returns:
         A tuple `(inserted_count, skipped_count)` with the number of state
@@ -343,17 +700,31 @@ def migrate_state_for_dex(
     inserted = 0
     skipped = 0
     state_coll = state_repo.collection
-
-    db = get_mongo_db()
-    events_coll = db[events_collection_name]
-
-    now = datetime.utcnow().isoformat()
-
-    for json_path in sorted(state_dir.glob("*.json")):
-        alias = json_path.stem
-
-        existing = state_coll.find_one({"dex": dex, "alias": alias})
-        if existing:
+    fast_state_coll = _unacknowledged(state_coll) if unacknowledged else None
+    state_docs: List[Dict[str, Any]] = []
+    staged: List[Tuple[str, str, Iterator[Dict[str, Any]]]] = []
+    pending_events: List[Dict[str, Any]] = []
+    staged_events = 0
+
+    # Acknowledged by default: the state doc is already stored when its events are
+    # written, so a silently dropped event batch would never be retried by a re-run.
+    events_db = get_mongo_db_for_migration() if unacknowledged else get_mongo_db()
+    events_coll = events_db[events_collection_name]
+
+    now_ms, now_iso = MongoEntity.now_stamp()
+
+    # Cheap snapshot so re-runs don't read/parse files of already migrated aliases;
+    # the $setOnInsert upsert stays the source of truth for anything that races it.
+    existing_aliases = {d["alias"] for d in state_coll.find({"dex": dex}, {"alias": 1, "_id": 0})}
+
+    with os.scandir(state_dir) as it:
+        entries = [e for e in it if e.name.endswith(".json") and e.is_file()]
+    entries.sort(key=lambda e: e.name)
+
+    to_read: List[Tuple[str, Path]] = []
+    for entry in entries:
+        alias = entry.name[: -len(".json")]
+        if alias in existing_aliases:
             logger.info(
                 "[state] DEX=%s alias=%s already exists in Mongo, skipping.",
                 dex,
@@ -361,19 +732,19 @@ def migrate_state_for_dex(
             )
             skipped += 1
             continue
+        to_read.append((alias, Path(entry.path)))
 
-        try:
-            with json_path.open("r", encoding="utf-8") as fh:
-                state_data = json.load(fh)
-            if not isinstance(state_data, dict):
-                logger.warning(
-                    "[state] File %s is not a JSON object, wrapping under 'raw' key.",
-                    json_path,
-                )
-                state_data = {"raw": state_data}
-        except Exception as exc:
-            logger.error("Failed to read state file %s: %s", json_path, exc)
+    # file reads/parsing overlap with the Mongo writes below
+    for alias, json_path, state_data in _read_state_files(to_read):
+        if isinstance(state_data, Exception):
+            logger.error("Failed to read state file %s: %s", json_path, state_data)
             continue
+        if not isinstance(state_data, dict):
+            logger.warning(
+                "[state] File %s is not a JSON object, wrapping under 'raw' key.",
+                json_path,
+            )
+            state_data = {"raw": state_data}
 
         short_state, events = _split_state_and_events(dex, alias, state_data)
 
@@ -381,41 +752,146 @@ def migrate_state_for_dex(
             "dex": dex,
             "alias": alias,
             "state": short_state,
-            "created_at": now,
-            "updated_at": now,
+            "created_at": now_ms,
+            "created_at_iso": now_iso,
+            "updated_at": now_ms,
+            "updated_at_iso": now_iso,
         }
-        safe_state_doc = normalize_for_bson(state_doc)
-        state_coll.insert_one(safe_state_doc)
+        state_docs.append(state_doc)
+        staged.append((alias, json_path.name, events))
+        staged_events += _history_len(state_data)
+
+        # large history files flush early so staged events never pile up across aliases
+        if len(state_docs) >= INSERT_BATCH_SIZE or staged_events >= EVENTS_BATCH_SIZE:
+            ins, skip = _flush_state_batch(
+                dex, state_coll, state_docs, staged, events_coll, pending_events, fast_state_coll
+            )
+            inserted += ins
+            skipped += skip
+            staged_events = 0
+
+    ins, skip = _flush_state_batch(
+        dex, state_coll, state_docs, staged, events_coll, pending_events, fast_state_coll
+    )
+    inserted += ins
+    skipped += skip
+
+    _flush_inserts(events_coll, pending_events, "events")
+
+    return inserted, skipped
+
+
+def _flush_state_batch(
+    dex: str,
+    state_coll: Collection,
+    state_docs: List[Dict[str, Any]],
+    staged: List[Tuple[str, str, Iterator[Dict[str, Any]]]],
+    events_coll: Collection,
+    pending_events: List[Dict[str, Any]],
+    fast_state_coll: Optional[Collection] = None,
+) -> Tuple[int, int]:
+    """
+    Upsert a batch of state documents and queue the events of the aliases that
+    were actually inserted. Aliases already present in Mongo keep their state
+    and their events are not migrated again.
+
+    With `fast_state_coll` (w=0) the server gives no per-document answer, so
+    every alias in the batch is treated as inserted; already migrated aliases
+    were filtered out up front by the existing-alias snapshot. An alias written
+    by a concurrent migrator after that snapshot has its state dropped by the
+    unique index but its events inserted again (vault_events has no unique key).
+
+    Returns:
+        A tuple `(inserted_count, skipped_count)` for the batch.
+    """
+    if fast_state_coll is not None:
+        n = len(state_docs)
+        _flush_inserts(fast_state_coll, state_docs, "state")
+        upserted = set(range(n))
+    else:
+        upserted = _flush_upserts(state_coll, state_docs, "state")
 
-        if events:
-            safe_events = [normalize_for_bson(e) for e in events]
-            events_coll.insert_many(safe_events)
+    inserted = 0
+    skipped = 0
+    for idx, (alias, file_name, events) in enumerate(staged):
+        if idx not in upserted:
+            logger.info(
+                "[state] DEX=%s alias=%s already exists in Mongo, skipping.",
+                dex,
+                alias,
+            )
+            skipped += 1
+            continue
+
+        # events are built lazily, accumulated across aliases and flushed in large batches
+        n_events = 0
+        for chunk in _chunked(events, INSERT_BATCH_SIZE):
+            n_events += len(chunk)
+            pending_events.extend(chunk)
+            if len(pending_events) >= EVENTS_BATCH_SIZE:
+                _flush_inserts(events_coll, pending_events, "events")
+
+        if n_events:
             logger.info(
                 "[state] Inserted DEX=%s alias=%s from %s (events=%d)",
                 dex,
                 alias,
-                json_path.name,
-                len(events),
+                file_name,
+                n_events,
             )
         else:
             logger.info(
                 "[state] Inserted DEX=%s alias=%s from %s (no events found)",
                 dex,
                 alias,
-                json_path.name,
+                file_name,
             )
 
         inserted += 1
 
+    staged.clear()
     return inserted, skipped
 
 
+def _migrate_one_dex(
+    dex: str,
+    data_root: Path,
+    registry_repo: VaultRegistryRepositoryMongoDB,
+    state_repo: VaultStateRepository,
+    unacknowledged: bool = False,
+) -> Tuple[int, int, int, int]:
+    """
+    Migrate registry and state for a single DEX.
+
+    Returns:
+        `(registry_inserted, registry_skipped, state_inserted, state_skipped)`.
+    """
+    logger.info("---- Migrating DEX: %s ----", dex)
+
+    reg_ins, reg_skip = migrate_vault_registry_for_dex(
+        dex, data_root, registry_repo, unacknowledged=unacknowledged
+    )
+    st_ins, st_skip = migrate_state_for_dex(
+        dex, data_root, state_repo, unacknowledged=unacknowledged
+    )
+
+    logger.info(
+        "DEX=%s registry: inserted=%d skipped=%d | state: inserted=%d skipped=%d",
+        dex,
+        reg_ins,
+        reg_skip,
+        st_ins,
+        st_skip,
+    )
+    return reg_ins, reg_skip, st_ins, st_skip
+
+
 def main() -> None:
     """
     Entry point for the migration script.
 
     - Discovers DEX folders under DATA_ROOT (or uses a CLI-provided filter).
-    - For each DEX:
+    - For each DEX (several DEXes in parallel):
         - Migrates registry from vaults.json → vault_registry.
         - Migrates per-alias state JSONs → vault_state + vault_events.
     """
@@ -431,6 +907,23 @@ def main() -> None:
             "If omitted, all subdirectories under DATA_ROOT are considered."
         ),
     )
+    parser.add_argument(
+        "--data-root",
+        dest="data_root",
+        help="Root folder of the legacy JSON files (defaults to the DATA_ROOT env var).",
+    )
+    parser.add_argument(
+        "--unacknowledged",
+        action="store_true",
+        help=(
+            "Fire-and-forget (w=0) inserts that rely on the repositories' unique "
+            "indexes (vault_registry: alias, vault_state: dex+alias) to drop "
+            "duplicates. Fastest, but per-document errors are not reported and "
+            "counts are documents sent, not confirmed. Do not run two migrators "
+            "at once in this mode: a state doc dropped as a duplicate still has "
+            "its events inserted, duplicating that alias's history."
+        ),
+    )
     args = parser.parse_args()
 
     logging.basicConfig(
@@ -439,11 +932,15 @@ def main() -> None:
     )
 
     settings = get_settings()
-    data_root_str = getattr(settings, "DATA_ROOT", None)
+    data_root_str = (
+        args.data_root
+        or getattr(settings, "DATA_ROOT", None)
+        or os.getenv("DATA_ROOT")
+    )
     if not data_root_str:
         raise RuntimeError(
-            "DATA_ROOT is not configured in settings. "
-            "Set it before running the migration script."
+            "DATA_ROOT is not configured. "
+            "Pass --data-root or set DATA_ROOT before running the migration script."
         )
 
     data_root = Path(data_root_str)
@@ -464,7 +961,7 @@ def main() -> None:
 
     logger.info("DEXes selected for migration: %s", ", ".join(dexes))
 
-    registry_repo = VaultRegistryRepository()
+    registry_repo = VaultRegistryRepositoryMongoDB()
     state_repo = VaultStateRepository()
 
     total_registry_inserted = 0
@@ -472,25 +969,27 @@ def main() -> None:
     total_state_inserted = 0
     total_state_skipped = 0
 
-    for dex in dexes:
-        logger.info("---- Migrating DEX: %s ----", dex)
-
-        reg_ins, reg_skip = migrate_vault_registry_for_dex(dex, data_root, registry_repo)
-        st_ins, st_skip = migrate_state_for_dex(dex, data_root, state_repo)
-
-        total_registry_inserted += reg_ins
-        total_registry_skipped += reg_skip
-        total_state_inserted += st_ins
-        total_state_skipped += st_skip
-
-        logger.info(
-            "DEX=%s registry: inserted=%d skipped=%d | state: inserted=%d skipped=%d",
-            dex,
-            reg_ins,
-            reg_skip,
-            st_ins,
-            st_skip,
-        )
+    # DEXes are independent and the work is Mongo/file I/O, so threads overlap well;
+    # pymongo collections are thread-safe and share the client's connection pool.
+    with ThreadPoolExecutor(max_workers=min(MAX_DEX_WORKERS, len(dexes))) as ex:
+        futures = {
+            ex.submit(
+                _migrate_one_dex, dex, data_root, registry_repo, state_repo, args.unacknowledged
+            ): dex
+            for dex in dexes
+        }
+        for fut in as_completed(futures):
+            dex = futures[fut]
+            try:
+                reg_ins, reg_skip, st_ins, st_skip = fut.result()
+            except Exception:
+                logger.exception("DEX=%s migration failed", dex)
+                continue
+
+            total_registry_inserted += reg_ins
+            total_registry_skipped += reg_skip
+            total_state_inserted += st_ins
+            total_state_skipped += st_skip
 
     logger.info("==== Migration summary ====")
     logger.info(